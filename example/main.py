@@ -4,13 +4,13 @@ It will connect to the Wago 750xxx bus, print the discovered modules and their c
 The modules will be polled regularly and the updated values will be printed to the console.
 """
 
+import json
 import logging
+import signal
 import sys
-import time
+import threading
 from typing import Any
 
-import yaml
-
 from wg750xxx.modules.channel import WagoChannel
 from wg750xxx.settings import HubConfig
 from wg750xxx.wg750xxx import PLCHub
@@ -32,7 +32,7 @@ def main() -> None:
     """Execute the main PLC monitoring process."""
     hub = PLCHub(HubConfig(host="10.22.22.16", port=502), True)
     log.info(
-        yaml.dump(
+        json.dumps(
             {"modules": [str(m.module_identifier) for m in hub.modules]}, indent=2
         )
     )
@@ -56,12 +56,12 @@ def main() -> None:
             30, discrete_interval=100, input_interval=100
         )
 
-    try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        if hub.connection is not None:
-            hub.connection.stop_continuous_update()
+    # Idle until Ctrl-C without a per-second polling wakeup
+    stop = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    stop.wait()
+    if hub.connection is not None:
+        hub.connection.stop_continuous_update()
 
 
 if __name__ == "__main__":
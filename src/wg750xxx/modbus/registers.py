@@ -7,9 +7,30 @@ from typing import Literal, Self, overload
 import numpy as np
 
 
+def words_to_int(
+    words: np.ndarray[tuple[int, ...], np.dtype[np.uint16]],
+    byteorder: Literal["little", "big"] = "big",
+) -> int:
+    """Convert a word array to an integer without building a Words object."""
+    arr = np.asarray(words, dtype=np.uint16)
+    return int.from_bytes(arr.astype(">u2", copy=False).tobytes(), byteorder)
+
+
+def words_to_string(words: np.ndarray[tuple[int, ...], np.dtype[np.uint16]]) -> str:
+    """Convert a word array to a string without building a Words object.
+
+    Zero words are skipped and each word is decoded low byte first.
+    """
+    arr = np.asarray(words, dtype=np.uint16)
+    nonzero = arr[arr != 0]
+    return nonzero.astype("<u2").tobytes().decode("latin-1").rstrip("\x00")
+
+
 class Bits:
     """A class to represent a Modbus one bit register of any length."""
 
+    __slots__ = ("_bits", "width")
+
     def __init__(
         self,
         bits: list[bool]
@@ -35,12 +56,9 @@ class Bits:
             size = self._bits.size
         # padding with zeros if width is greater than the number of bits given
         if size > len(self._bits):
-            self._bits = np.pad(
-                self._bits,
-                (0, size - len(self._bits)),
-                mode="constant",
-                constant_values=False,
-            )
+            padded = np.zeros(size, dtype=self._bits.dtype)
+            padded[: self._bits.size] = self._bits
+            self._bits = padded
         elif size < len(self._bits):
             self._bits = self._bits[:size]
         self.width: int = len(self._bits)
@@ -108,8 +126,12 @@ class Bits:
 
     def value_to_int(self, byteorder: Literal["big", "little"] = "big") -> int:
         """Get the bit register content as integer representation."""
-        bytes_instance = self.value_to_bytes()
-        return int.from_bytes(bytes_instance.value, byteorder=byteorder)
+        # Equivalent to value_to_bytes() (big byte order) + int.from_bytes,
+        # but packed in C instead of a per-byte Python loop. value_to_bytes
+        # reverses the byte list for "big", so the byte order passed to
+        # int.from_bytes is inverted here.
+        packed = np.packbits(self._bits, bitorder="little").tobytes()
+        return int.from_bytes(packed, "little" if byteorder == "big" else "big")
 
     def value_to_bytes(self, byteorder: Literal["big", "little"] = "big") -> "Bytes":
         """Get the bit register content as byte register."""
@@ -142,9 +164,9 @@ class Bits:
 
     def value_to_string(self) -> str:
         """Get the bit register content as string representation."""
-        return "".join(
-            [f"{chr(b & 0x00FF)}{chr(b >> 8)}" for b in self._bits if b != 0]
-        ).rstrip("\x00")
+        # Nonzero entries decoded low byte first, as the old chr() loop did
+        nonzero = self._bits[self._bits]
+        return nonzero.astype("<u2").tobytes().decode("latin-1").rstrip("\x00")
 
     @overload
     def __getitem__(self, index: int) -> bool: ...
@@ -180,14 +202,6 @@ class Bits:
         """Get the iterator of the bit register."""
         return iter(self._bits)
 
-    def __next__(self):
-        """Get the next bit in the bit register."""
-        return next(self._bits)
-
-    def __missing__(self, index: int):
-        """Get the bit at a specific index."""
-        return self._bits[index]
-
     def __contains__(self, item) -> bool:
         """Check if the bit register contains a specific item."""
         if isinstance(item, Words):
@@ -208,7 +222,8 @@ class Bits:
 
     def __hash__(self) -> int:
         """Get the hash of the bit register."""
-        return hash(self._bits)
+        # ndarrays are unhashable, hash the packed byte content instead
+        return hash(self._bits.tobytes())
 
 
 class Bytes:
@@ -227,6 +242,8 @@ class Bytes:
 
     """
 
+    __slots__ = ("_bytes", "width")
+
     def __init__(
         self,
         value: list[int]
@@ -252,12 +269,9 @@ class Bytes:
             size = self._bytes.size
         # padding with zeros if width is greater than the number of bytes given
         if size > self._bytes.size:
-            self._bytes = np.pad(
-                self._bytes,
-                (0, size - self._bytes.size),
-                mode="constant",
-                constant_values=0,
-            )
+            padded = np.zeros(size, dtype=self._bytes.dtype)
+            padded[: self._bytes.size] = self._bytes
+            self._bytes = padded
         elif size < self._bytes.size:
             self._bytes = self._bytes[:size]
         self.width: int = self._bytes.size
@@ -329,15 +343,19 @@ class Bytes:
 
     def value_to_hex(self) -> str:
         """Get the byte register content as hexadecimal string representation."""
-        return "".join([f"{b:02X}" for b in self._bytes])
+        return self._bytes.tobytes().hex().upper()
 
     def value_to_bin(self) -> str:
         """Get the byte register content as binary string representation."""
-        return "".join([f"{b:08b}" for b in self._bytes])
+        bits = np.unpackbits(self._bytes)
+        return (bits + ord("0")).astype(np.uint8).tobytes().decode("ascii")
 
     def value_to_int(self, byteorder: Literal["little", "big"] = "little") -> int:
         """Get the byte register content as integer representation."""
-        return int.from_bytes(bytes(self._bytes.tolist()), byteorder=byteorder)
+        # astype guards against wider dtypes leaking in via from_int/np.append
+        return int.from_bytes(
+            self._bytes.astype(np.uint8, copy=False).tobytes(), byteorder=byteorder
+        )
 
     def bits(self) -> Bits:
         """Get the byte register content as bit register."""
@@ -404,10 +422,6 @@ class Bytes:
         """Get the iterator of the byte register."""
         return iter(self._bytes)
 
-    def __next__(self) -> int:
-        """Get the next byte in the byte register."""
-        return int(next(iter(self._bytes)))
-
 
 class Words:
     """A class to represent a Modbus word (16-bit) register of any length.
@@ -425,6 +439,8 @@ class Words:
 
     """
 
+    __slots__ = ("_words", "width")
+
     def __init__(
         self,
         value: list[int]
@@ -449,12 +465,9 @@ class Words:
             size = self._words.size
         # padding with zeros if width is greater than the number of words given
         if size > len(self._words):
-            self._words = np.pad(
-                self._words,
-                (0, size - len(self._words)),
-                mode="constant",
-                constant_values=0,
-            )
+            padded = np.zeros(size, dtype=self._words.dtype)
+            padded[: self._words.size] = self._words
+            self._words = padded
         elif size < len(self._words):
             self._words = self._words[:size]
         self.width: int = len(self._words)
@@ -523,40 +536,54 @@ class Words:
 
     def value_to_hex(self) -> str:
         """Get the word register content as hexadecimal string representation."""
-        return "".join([f"{w:04X}" for w in self._words])
+        return self._words.astype(">u2", copy=False).tobytes().hex().upper()
 
     def value_to_bin(self) -> str:
         """Get the word register content as binary string representation."""
-        return "".join([f"{b:016b}" for b in self._words])
+        bits = np.unpackbits(self._words.astype(">u2", copy=False).view(np.uint8))
+        return (bits + ord("0")).astype(np.uint8).tobytes().decode("ascii")
 
     def value_to_int(self, byteorder: Literal["little", "big"] = "big") -> int:
         """Get the word register content as integer representation."""
-        return self.bytes(byteorder).value_to_int()
+        return words_to_int(self._words, byteorder)
 
     def bits(self) -> Bits:
-        """Get the word register content as bit register."""
-        bit_list: list[bool] = []
-        for word in self._words:
-            bit_list.extend(bool((word >> i) & 1) for i in range(15, -1, -1))
-        return Bits(bit_list)
+        """Get the word register content as bit register.
+
+        Materializes every bit into a new Bits object; for single-bit access
+        in hot paths use get_bit/set_bit instead.
+        """
+        # MSB-first per word, identical to unpacking the big-endian bytes
+        bit_array = np.unpackbits(self._words.astype(">u2", copy=False).view(np.uint8))
+        return Bits(bit_array.astype(bool))
+
+    def get_bit(self, index: int) -> bool:
+        """Get a single bit without materializing the full bit register.
+
+        Uses the same MSB-first ordering as bits(), so get_bit(i) matches
+        bits()[i].
+        """
+        word_index, offset = divmod(index, 16)
+        return bool((int(self._words[word_index]) >> (15 - offset)) & 1)
+
+    def set_bit(self, index: int, value: bool) -> None:
+        """Set a single bit in place, using the same ordering as bits()."""
+        word_index, offset = divmod(index, 16)
+        mask = 1 << (15 - offset)
+        if value:
+            self._words[word_index] |= mask
+        else:
+            self._words[word_index] &= 0xFFFF ^ mask
 
     def bytes(self, byteorder: str = "little") -> Bytes:
         """Convert the word register to a byte register."""
-        byte_list = []
+        # Reinterpreting the words with an explicit endianness yields the
+        # same byte sequence the old per-word loop built one pair at a time
         if byteorder == "big":
-            words = np.flip(self._words)
+            byte_array = np.flip(self._words).astype("<u2").view(np.uint8)
         else:
-            words = self._words
-        for word in words:
-            high_byte = (word >> 8) & 0xFF
-            low_byte = word & 0xFF
-            if byteorder == "big":
-                byte_list.append(low_byte)
-                byte_list.append(high_byte)
-            else:
-                byte_list.append(high_byte)
-                byte_list.append(low_byte)
-        return Bytes(byte_list)
+            byte_array = self._words.astype(">u2").view(np.uint8)
+        return Bytes(byte_array)
 
     def __int__(self) -> int:
         """Get the word register content as integer representation."""
@@ -564,9 +591,7 @@ class Words:
 
     def value_to_string(self) -> str:
         """Get the word register content as string representation."""
-        return "".join(
-            [f"{chr(b & 0x00FF)}{chr(b >> 8)}" for b in self._words if b != 0]
-        ).rstrip("\x00")
+        return words_to_string(self._words)
 
     def __getitem__(self, index: slice | int) -> Self:
         """Get the word register content at a specific index or slice."""
@@ -598,14 +623,6 @@ class Words:
         """Get the iterator of the word register."""
         return iter(self._words)
 
-    def __next__(self) -> int:
-        """Get the next word in the word register."""
-        return int(next(iter(self._words)))
-
-    def __missing__(self, index: int) -> int:
-        """Get the word at a specific index."""
-        return self._words[index]
-
     def __contains__(self, item) -> bool:
         """Check if the word register contains a specific item."""
         if isinstance(item, Words):
@@ -626,12 +643,15 @@ class Words:
 
     def __hash__(self) -> int:
         """Get the hash of the word register."""
-        return hash(self._words)
+        # ndarrays are unhashable, hash the raw byte content instead
+        return hash(self._words.tobytes())
 
 
 class Register(Words):
     """A class to represent a Modbus register with an address."""
 
+    __slots__ = ("address",)
+
     def __init__(self, address: int, *args, **kwargs) -> None:
         """Initialize the Register class."""
         self.address: int = address
@@ -661,7 +681,11 @@ class Register(Words):
 
     def __eq__(self, other) -> bool:
         """Check if the register is equal to another register."""
-        return self.address == other.address and self._words == other.value
+        return (
+            isinstance(other, Register)
+            and self.address == other.address
+            and np.array_equal(self._words, other._words)
+        )
 
     def __ne__(self, other) -> bool:
         """Check if the register is not equal to another register."""
@@ -669,7 +693,7 @@ class Register(Words):
 
     def __hash__(self) -> int:
         """Get the hash of the register."""
-        return hash(self.address) ^ hash(self._words)
+        return hash((self.address, self._words.tobytes()))
 
 
 test_constants = [
@@ -683,3 +707,8 @@ test_constants = [
     Register(0x2007, [0x3FFF]),  # GP_HALF_POS
     Register(0x2008, [0x4000]),  # GP_HALF_NEG
 ]
+
+# The expected test constant values as one array for vectorized comparison
+test_constants_values = np.array(
+    [register.value_to_int() for register in test_constants], dtype=np.uint16
+)
@@ -1,13 +1,17 @@
 """Module for handling Modbus communication and channel types for WAGO 750 series I/O modules."""
 
 from abc import abstractmethod
-from collections.abc import Callable, ItemsView
+from collections.abc import Callable, ItemsView, Iterator
+from contextlib import contextmanager
 from functools import wraps
 import logging
-from threading import Thread
+import random
+import socket
+from threading import Condition, Event, Lock, Thread
 import time
 from typing import Any, ClassVar, Literal, Optional, Self, cast, get_args
 
+import numpy as np
 from pymodbus.client import ModbusTcpClient
 
 from wg750xxx.const import DEFAULT_SCAN_INTERVAL
@@ -16,7 +20,19 @@ from .exceptions import ModbusCommunicationError
 from .registers import Bits, Words
 
 log = logging.getLogger(__name__)
+
+# Modbus PDU caps: one read may carry at most 125 registers or 2000 bits
+MAX_REGISTERS_PER_READ = 125
+MAX_BITS_PER_READ = 2000
+
+# Idle state tables back off multiplicatively up to this factor of their
+# configured interval; any observed change snaps them back to 1x
+ADAPTIVE_INTERVAL_CEILING = 8
+
 ModbusChannelType = Literal["coil", "discrete", "input", "holding"]
+# Frozen set of the valid channel types, so membership checks in the
+# ModbusChannelSpec hot paths skip re-deriving the Literal args per call
+CHANNEL_TYPES: frozenset[str] = frozenset(get_args(ModbusChannelType))
 ModbusBits = list[bool]
 AddressDict = dict[ModbusChannelType, int]
 ModbusChannelState = int | bool
@@ -34,7 +50,7 @@ class ModbusChannelSpec:
 
         """
         # Check if all keys in kwargs are in the ModbusChannelType enum
-        if not all(key in get_args(ModbusChannelType) for key in kwargs):
+        if not all(key in CHANNEL_TYPES for key in kwargs):
             raise ValueError(f"Invalid channel type: {list(kwargs.keys())}")
         self._spec: dict[ModbusChannelType, int] = (
             spec if spec is not None else cast(dict[ModbusChannelType, int], kwargs)
@@ -42,7 +58,7 @@ class ModbusChannelSpec:
 
     def __getitem__(self, key: ModbusChannelType) -> int:
         """Get the number of channels for a specific type."""
-        if key not in get_args(ModbusChannelType):
+        if key not in CHANNEL_TYPES:
             raise ValueError(f"Invalid channel type: {key}")
         if key not in self._spec:
             return 0
@@ -50,7 +66,7 @@ class ModbusChannelSpec:
 
     def __setitem__(self, key: ModbusChannelType, value: int) -> None:
         """Set the number of channels for a specific type."""
-        if key not in get_args(ModbusChannelType):
+        if key not in CHANNEL_TYPES:
             raise ValueError(f"Invalid channel type: {key}")
         self._spec[key] = value
 
@@ -60,14 +76,14 @@ class ModbusChannelSpec:
 
     def get(self, key: ModbusChannelType, default: int = 0) -> int:
         """Get the number of channels for a specific type."""
-        if key not in get_args(ModbusChannelType):
+        if key not in CHANNEL_TYPES:
             raise ValueError(f"Invalid channel type: {key}")
         return self._spec.get(key, default)
 
     def __getattr__(self, key: str) -> int:
         """Get the number of channels for a specific type."""
         # Only handle valid ModbusChannelType keys
-        if key in get_args(ModbusChannelType):
+        if key in CHANNEL_TYPES:
             return self._spec.get(cast(ModbusChannelType, key), 0)
         # For everything else, raise AttributeError (let Python handle private/internal attributes)
         raise AttributeError(
@@ -76,14 +92,14 @@ class ModbusChannelSpec:
 
     def __setattr__(self, key: str, value: int) -> None:
         """Set the number of channels for a specific type."""
-        if key in get_args(ModbusChannelType):
+        if key in CHANNEL_TYPES:
             self._spec[cast(ModbusChannelType, key)] = value
         else:
             super().__setattr__(key, value)
 
     def __delattr__(self, key: str) -> None:
         """Delete the number of channels for a specific type."""
-        if key in get_args(ModbusChannelType):
+        if key in CHANNEL_TYPES:
             del self._spec[cast(ModbusChannelType, key)]
         else:
             super().__delattr__(key)
@@ -98,7 +114,7 @@ class ModbusChannelSpec:
 
     def __contains__(self, key: ModbusChannelType) -> bool:
         """Check if the ModbusChannelSpec contains a specific type."""
-        if key not in get_args(ModbusChannelType):
+        if key not in CHANNEL_TYPES:
             raise ValueError(f"Invalid channel type: {key}")
         return key in self._spec
 
@@ -106,7 +122,7 @@ class ModbusChannelSpec:
         """Get the number of channels for a specific type."""
         if key is None:
             return sum(self._spec.values())
-        if key not in get_args(ModbusChannelType):
+        if key not in CHANNEL_TYPES:
             raise ValueError(f"Invalid channel type: {key}")
         return self._spec[key]
 
@@ -115,18 +131,55 @@ class ModbusChannelSpec:
         return self._spec.items()
 
 
+class ReadWriteLock:
+    """A minimal readers-writer lock for the read-heavy state access pattern.
+
+    Any number of readers may hold the lock concurrently; a writer waits for
+    active readers to drain and blocks new readers while it runs.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the lock."""
+        self._condition = Condition()
+        self._readers = 0
+
+    @contextmanager
+    def reader(self) -> Iterator[None]:
+        """Acquire the lock for reading."""
+        with self._condition:
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def writer(self) -> Iterator[None]:
+        """Acquire the lock for writing."""
+        with self._condition:
+            while self._readers > 0:
+                self._condition.wait()
+            yield
+
+
 def auto_reconnect(func: Callable, retries: int = 3) -> Callable:
     """Annotate the function to automatically reconnect to the Modbus server."""
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        for _ in range(retries):
+        for attempt in range(retries):
             try:
                 return func(*args, **kwargs)
-            except BrokenPipeError as e:  # noqa: PERF203
+            except (BrokenPipeError, ConnectionResetError, OSError) as e:  # noqa: PERF203
                 log.warning(
                     "Failed to execute %s: %s, reconnecting...", func.__name__, e
                 )
+                # Exponential backoff with jitter so a struggling server is
+                # not hammered with back-to-back reconnect attempts
+                time.sleep((2**attempt) * 0.05 + random.random() * 0.05)
                 args[0].reconnect()
         raise ModbusCommunicationError(
             f"Failed to execute {func.__name__} after {retries} retries"
@@ -215,30 +268,42 @@ class ModbusState:
         new_state.holding = self.holding.copy()
         return new_state
 
+    def snapshot(self) -> "ModbusState":
+        """Create a snapshot sharing the current table objects.
+
+        Only safe together with copy-on-write updates: writers publish new
+        table objects instead of mutating the shared ones in place.
+        """
+        new_state = ModbusState.__new__(ModbusState)
+        new_state.coil = self.coil
+        new_state.discrete = self.discrete
+        new_state.input = self.input
+        new_state.holding = self.holding
+        return new_state
+
     def get_changed_addresses(
         self, other: Self, channel_types: Optional[list[ModbusChannelType]] = None
     ) -> dict[ModbusChannelType, set[int]]:
         """Get the addresses that have changed between the current state and the previous state."""
         changed_addresses: dict[ModbusChannelType, set[int]] = {}
         if channel_types is None:
-            channel_types = list(get_args(ModbusChannelType))
+            channel_types = list(CHANNEL_TYPES)
         for key in channel_types or []:
-            changed_addresses[key] = set()
             self_state = getattr(self, key)
             other_state = getattr(other, key)
             # Get the minimum length to avoid index errors
             min_length = min(len(self_state), len(other_state))
 
-            # Compare values at each address in the range
-            for i in range(min_length):
-                if self_state[i] != other_state[i]:
-                    changed_addresses[key].add(i)
+            # Compare the overlapping range in one vectorized pass
+            changed = set(
+                np.flatnonzero(
+                    self_state.value[:min_length] != other_state.value[:min_length]
+                ).tolist()
+            )
 
             # If one state is longer than the other, all the additional addresses have changed
-            if len(self_state) > min_length:
-                changed_addresses[key].update(range(min_length, len(self_state)))
-            if len(other_state) > min_length:
-                changed_addresses[key].update(range(min_length, len(other_state)))
+            changed.update(range(min_length, max(len(self_state), len(other_state))))
+            changed_addresses[key] = changed
 
         return changed_addresses
 
@@ -248,6 +313,13 @@ class ModbusConnection:
 
     Used to update and cache the state of the modules connected to the hub.
 
+    Transport note: requests are issued serially through pymodbus's
+    synchronous client on purpose. The 750 controllers answer one
+    transaction at a time, so pipelining several transaction IDs on one
+    socket does not overlap work on the wire; round trips are minimized
+    instead by merging and chunking reads (see request_read/flush_reads)
+    so each poll tick sends as few PDUs as the protocol allows.
+
     Args:
         modbus_tcp_client: The Modbus TCP client to use for the connection.
         count_bits_analog_in: The number of bits in the analog input registers.
@@ -265,6 +337,8 @@ class ModbusConnection:
         modbus_tcp_client: ModbusTcpClient,
         bits_in_state: ModbusChannelSpec,
         update_interval: int = DEFAULT_SCAN_INTERVAL,
+        tcp_nodelay: bool = True,
+        keepalive: bool = True,
     ) -> None:
         """Initialize the ModbusConnection.
 
@@ -272,9 +346,15 @@ class ModbusConnection:
             modbus_tcp_client: The Modbus TCP client to use for communication.
             bits_in_state: Dictionary specifying the number of bits for each channel type.
             update_interval: The interval in milliseconds between updates.
+            tcp_nodelay: Disable Nagle's algorithm on the client socket.
+            keepalive: Enable TCP keepalive on the client socket.
 
         """
         self.modbus_tcp_client = modbus_tcp_client
+        self._tcp_nodelay = tcp_nodelay
+        self._keepalive = keepalive
+        self._set_socket_options()
+        self._bind_client_shortcuts()
         self.bits_in_state: ModbusChannelSpec = bits_in_state
         self.state: ModbusState = ModbusState(
             ModbusChannelSpec(
@@ -286,6 +366,7 @@ class ModbusConnection:
         )
         self._update_thread: Thread | None = None
         self._running = False
+        self._stop_event = Event()
         # Default update intervals in seconds for each state type
         self._update_intervals = {
             "input": update_interval,
@@ -300,6 +381,37 @@ class ModbusConnection:
             "coil": 0.0,
         }
 
+        # One readers-writer lock per state table: the polling thread is
+        # the writer, channel reads from other threads are the readers
+        self._state_locks: dict[ModbusChannelType, ReadWriteLock] = {
+            "input": ReadWriteLock(),
+            "holding": ReadWriteLock(),
+            "discrete": ReadWriteLock(),
+            "coil": ReadWriteLock(),
+        }
+
+        # One in-flight transaction per transport: the pymodbus sync
+        # client is not thread-safe, so caller-thread writes and polling
+        # reads must not interleave on the socket
+        self._transaction_lock = Lock()
+
+        # Version counters bumped on every table publish; readers spanning
+        # several cells can snapshot, re-check and retry instead of locking
+        self._state_versions: dict[ModbusChannelType, int] = {
+            "input": 0,
+            "holding": 0,
+            "discrete": 0,
+            "coil": 0,
+        }
+
+        # Refresh ranges queued by request_read, merged by flush_reads
+        self._pending_reads: dict[ModbusChannelType, list[tuple[int, int]]] = {
+            "input": [],
+            "holding": [],
+            "discrete": [],
+            "coil": [],
+        }
+
         # Channel callback registry: {channel_type: {address: [channels]}}
         self._channel_registry: dict[ModbusChannelType, dict[int, list[Any]]] = {
             "input": {},
@@ -308,13 +420,78 @@ class ModbusConnection:
             "coil": {},
         }
 
+    def _read_registers_chunked(
+        self, read_call: Callable, address: int, width: int
+    ) -> list[int]:
+        """Read a register range with as few PDUs as the protocol cap allows."""
+        with self._transaction_lock:
+            if width <= MAX_REGISTERS_PER_READ:
+                return read_call(address, count=width).registers
+            registers: list[int] = []
+            for start in range(address, address + width, MAX_REGISTERS_PER_READ):
+                count = min(MAX_REGISTERS_PER_READ, address + width - start)
+                registers += read_call(start, count=count).registers
+            return registers
+
+    def _read_bits_chunked(
+        self, read_call: Callable, address: int, width: int
+    ) -> list[bool]:
+        """Read a bit range with as few PDUs as the protocol cap allows."""
+        with self._transaction_lock:
+            if width <= MAX_BITS_PER_READ:
+                return read_call(address, count=width).bits
+            bits: list[bool] = []
+            for start in range(address, address + width, MAX_BITS_PER_READ):
+                count = min(MAX_BITS_PER_READ, address + width - start)
+                bits += read_call(start, count=count).bits
+            return bits
+
+    def _bind_client_shortcuts(self) -> None:
+        """Bind the client read/write methods used on every poll tick.
+
+        Saves the repeated attribute-chain lookups in the hot update and
+        write paths. Must be rebound after every reconnect in case the
+        underlying transport was replaced.
+        """
+        client = self.modbus_tcp_client
+        self._read_input_registers = client.read_input_registers
+        self._read_holding_registers = client.read_holding_registers
+        self._read_discrete_inputs = client.read_discrete_inputs
+        self._read_coils = client.read_coils
+        self._write_coil = client.write_coil
+        self._write_coils = client.write_coils
+        self._write_register = client.write_register
+        self._write_registers = client.write_registers
+
+    def _set_socket_options(self) -> None:
+        """Disable Nagle's algorithm and enable keepalive on the client socket.
+
+        The polling loop and the write-then-poll sequences send small
+        back-to-back PDUs, exactly the pattern Nagle/delayed-ACK stalls.
+        Must be reapplied after every reconnect. Both options are governed
+        by the flags passed to the constructor (HubConfig on the hub path).
+        """
+        try:
+            sock = self.modbus_tcp_client.socket
+            if sock is not None:
+                if self._tcp_nodelay:
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                if self._keepalive:
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except (AttributeError, OSError):
+            # Socket attribute naming differs between pymodbus versions
+            log.debug("Could not set socket options on the Modbus TCP client")
+
     def reconnect(self) -> None:
         """Reconnect to the Modbus server."""
-        if not self.modbus_tcp_client.is_socket_open():
-            self.modbus_tcp_client.connect()
-        else:
-            self.modbus_tcp_client.close()
-            self.modbus_tcp_client.connect()
+        with self._transaction_lock:
+            if not self.modbus_tcp_client.is_socket_open():
+                self.modbus_tcp_client.connect()
+            else:
+                self.modbus_tcp_client.close()
+                self.modbus_tcp_client.connect()
+            self._set_socket_options()
+            self._bind_client_shortcuts()
 
     @auto_reconnect
     def _update_input_state(
@@ -333,17 +510,22 @@ class ModbusConnection:
             width = (
                 self.bits_in_state["input"] // 16 - address
             )  # if no width is provided, read the entire input state starting from the address
-        registers = Words(
-            self.modbus_tcp_client.read_input_registers(address, count=width).registers
-        )
-        log.debug(
-            "Updating input state from 0x%s - 0x%s with width %d",
-            f"{address:04x}",
-            f"{address + width:04x}",
-            width,
+        registers = self._read_registers_chunked(
+            self._read_input_registers, address, width
         )
-        log.debug("Registers: %s", registers.value_to_hex())
-        self.state.input[address : address + width] = registers
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Updating input state from 0x%04x - 0x%04x with width %d",
+                address,
+                address + width,
+                width,
+            )
+            log.debug("Registers: %s", Words(registers).value_to_hex())
+        with self._state_locks["input"].writer():
+            new_input = self.state.input.copy()
+            new_input[address : address + width] = registers
+            self.state.input = new_input
+            self._state_versions["input"] += 1
 
     @auto_reconnect
     def _update_holding_state(
@@ -362,19 +544,22 @@ class ModbusConnection:
             address = address + 0x0200
         if width is None:
             width = (self.bits_in_state["holding"] // 16 + 0x0200) - address
-        registers = Words(
-            self.modbus_tcp_client.read_holding_registers(
-                address, count=width
-            ).registers
-        )
-        log.debug(
-            "Updating holding state from 0x%s - 0x%s with width %d",
-            f"{address:04x}",
-            f"{address + width:04x}",
-            width,
+        registers = self._read_registers_chunked(
+            self._read_holding_registers, address, width
         )
-        log.debug("Registers: %s", registers.value_to_hex())
-        self.state.holding[address - 0x0200 : address + width - 0x0200] = registers
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Updating holding state from 0x%04x - 0x%04x with width %d",
+                address,
+                address + width,
+                width,
+            )
+            log.debug("Registers: %s", Words(registers).value_to_hex())
+        with self._state_locks["holding"].writer():
+            new_holding = self.state.holding.copy()
+            new_holding[address - 0x0200 : address + width - 0x0200] = registers
+            self.state.holding = new_holding
+            self._state_versions["holding"] += 1
 
     @auto_reconnect
     def _update_discrete_state(
@@ -393,18 +578,23 @@ class ModbusConnection:
             address = address + 0x0000
         if width is None:
             width = (self.bits_in_state["discrete"] + 0x0000) - address
-        bits = Bits(
-            self.modbus_tcp_client.read_discrete_inputs(address, count=width).bits,
-            size=width,
-        )
-        log.debug(
-            "Updating discrete state from 0x%s - 0x%s with width %d",
-            f"{address:04x}",
-            f"{address + width:04x}",
-            width,
-        )
-        log.debug("Bits: %s", bits.value_to_bin())
-        self.state.discrete[address : address + width] = bits
+        # Responses pad bit counts to byte multiples, so trim to width
+        bits = self._read_bits_chunked(self._read_discrete_inputs, address, width)[
+            :width
+        ]
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Updating discrete state from 0x%04x - 0x%04x with width %d",
+                address,
+                address + width,
+                width,
+            )
+            log.debug("Bits: %s", Bits(bits, size=width).value_to_bin())
+        with self._state_locks["discrete"].writer():
+            new_discrete = self.state.discrete.copy()
+            new_discrete[address : address + width] = bits
+            self.state.discrete = new_discrete
+            self._state_versions["discrete"] += 1
 
     @auto_reconnect
     def _update_coil_state(
@@ -423,33 +613,94 @@ class ModbusConnection:
             address = address + 0x0200
         if width is None:
             width = (self.bits_in_state["coil"] + 0x0200) - address
-        bits = Bits(
-            self.modbus_tcp_client.read_coils(address, count=width).bits, size=width
-        )
-        log.debug(
-            "Updating coil state from 0x%s - 0x%s with width %d",
-            f"{address:04x}",
-            f"{address + width:04x}",
-            width,
+        bits = self._read_bits_chunked(self._read_coils, address, width)[:width]
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Updating coil state from 0x%04x - 0x%04x with width %d",
+                address,
+                address + width,
+                width,
+            )
+            log.debug("Bits: %s", Bits(bits, size=width).value_to_bin())
+        with self._state_locks["coil"].writer():
+            new_coil = self.state.coil.copy()
+            new_coil[address - 0x0200 : address + width - 0x0200] = bits
+            self.state.coil = new_coil
+            self._state_versions["coil"] += 1
+
+    @staticmethod
+    def _merge_ranges(
+        ranges: list[tuple[int, int]], gap_threshold: int = 8
+    ) -> list[tuple[int, int]]:
+        """Merge overlapping or near-adjacent (address, width) ranges.
+
+        Ranges closer together than gap_threshold are read as one request,
+        since a few extra registers are cheaper than another round-trip.
+        """
+        if len(ranges) <= 1:
+            return list(ranges)
+        merged: list[tuple[int, int]] = []
+        for start, width in sorted(ranges):
+            if merged and start <= merged[-1][0] + merged[-1][1] + gap_threshold:
+                last_start, last_width = merged[-1]
+                merged[-1] = (last_start, max(last_width, start + width - last_start))
+            else:
+                merged.append((start, width))
+        return merged
+
+    def request_read(
+        self, channel_type: ModbusChannelType, address: int, width: int = 1
+    ) -> None:
+        """Queue a state refresh for a range, executed by the next flush_reads."""
+        self._pending_reads[channel_type].append((address, width))
+
+    def flush_reads(self, channel_type: ModbusChannelType | None = None) -> None:
+        """Execute queued refreshes with one read per merged address cluster."""
+        channel_types = (
+            [channel_type] if channel_type is not None else list(self._pending_reads)
         )
-        log.debug("Bits: %s", bits.value_to_bin())
-        self.state.coil[address - 0x0200 : address + width - 0x0200] = bits
+        for pending_type in channel_types:
+            pending = self._pending_reads[pending_type]
+            if not pending:
+                continue
+            self._pending_reads[pending_type] = []
+            for start, width in self._merge_ranges(pending):
+                if pending_type == "input":
+                    self._update_input_state(start, width)
+                elif pending_type == "holding":
+                    self._update_holding_state(start, width)
+                elif pending_type == "discrete":
+                    self._update_discrete_state(start, width)
+                elif pending_type == "coil":
+                    self._update_coil_state(start, width)
 
     def update_state(
         self,
         states_to_update: list[ModbusChannelType] | ModbusChannelType | None = None,
-    ) -> None:
-        """Update the state of the ModbusConnection."""
+    ) -> dict[ModbusChannelType, set[int]]:
+        """Update the state of the ModbusConnection.
+
+        Returns:
+            The addresses that changed per updated state type.
+
+        """
         if states_to_update is None:
             states_to_update = ["coil", "discrete", "input", "holding"]
         if isinstance(states_to_update, str):
             states_to_update = [states_to_update]
-
-        current_state = self.state.copy()
+        # Skip tables no module maps into; an empty read is still a full PDU
+        # round trip on the wire
+        states_to_update = [
+            state_type
+            for state_type in states_to_update
+            if self.bits_in_state[state_type] > 0
+        ]
+
+        # Snapshot the current table references (updates publish new
+        # objects), then issue all due reads back-to-back so the batch
+        # completes before any change notifications run
+        current_state = self.state.snapshot()
         for modbus_channel_type in states_to_update:
-            # Store the current state before updating
-
-            # Update the state
             if modbus_channel_type == "input":
                 self._update_input_state()
             elif modbus_channel_type == "holding":
@@ -459,15 +710,15 @@ class ModbusConnection:
             elif modbus_channel_type == "coil":
                 self._update_coil_state()
 
-            # Get changed addresses
-            changed_addresses = self.state.get_changed_addresses(
-                current_state, channel_types=[modbus_channel_type]
-            )
-
-            # Notify channels about changes
+        # Get changed addresses and notify channels about changes
+        changed_addresses = self.state.get_changed_addresses(
+            current_state, channel_types=states_to_update
+        )
+        for modbus_channel_type in states_to_update:
             self._notify_channels_of_changes(
                 modbus_channel_type, changed_addresses[modbus_channel_type]
             )
+        return changed_addresses
 
     def _notify_channels_of_changes(
         self, channel_type: ModbusChannelType, changed_addresses: set[int]
@@ -502,32 +753,61 @@ class ModbusConnection:
             log.info("Starting continuous state update thread")
             self._running = True
 
-        update_counter = dict.fromkeys(self._update_intervals, 0)
-        last_log_time = time.time()
+        # Both dicts are mutated in place by set_update_interval, so binding
+        # them once keeps runtime interval changes visible while avoiding the
+        # per-tick attribute lookups in the hot loop
+        intervals = self._update_intervals
+        last_updates = self._last_updates
+        update_counter = dict.fromkeys(intervals, 0)
+        # AIMD backoff per state type: idle tables poll less often, any
+        # change snaps the factor back so active tables stay fresh
+        backoff = dict.fromkeys(intervals, 1)
+        last_log_time = time.monotonic()
         while self._running:
             try:
-                current_time = time.time()
-                # Check and update each state type based on its interval
-                for state_type, interval in self._update_intervals.items():
-                    if current_time - self._last_updates[state_type] >= interval / 1000:
-                        log.debug("Updating %s state", state_type)
+                current_time = time.monotonic()
+                # Collect every state type that is due and update them in a
+                # single pass so each tick pays for one state snapshot/diff
+                # instead of one per type.
+                due_types = [
+                    state_type
+                    for state_type, interval in intervals.items()
+                    if current_time - last_updates[state_type]
+                    >= interval * backoff[state_type] / 1000
+                ]
+                if due_types:
+                    log.debug("Updating %s state", ", ".join(due_types))
+                    for state_type in due_types:
                         update_counter[state_type] += 1
-                        self.update_state(cast(ModbusChannelType, state_type))
-                        self._last_updates[state_type] = current_time
+                        last_updates[state_type] = current_time
+                    changed = self.update_state(
+                        cast(list[ModbusChannelType], due_types)
+                    )
+                    for state_type in due_types:
+                        if changed.get(state_type):
+                            backoff[state_type] = 1
+                        else:
+                            backoff[state_type] = min(
+                                backoff[state_type] * 2, ADAPTIVE_INTERVAL_CEILING
+                            )
                 if current_time - last_log_time > 30:
                     log.info("Updates in last 30 seconds: %s", str(update_counter))
-                    update_counter = dict.fromkeys(self._update_intervals, 0)
+                    update_counter = dict.fromkeys(intervals, 0)
                     last_log_time = current_time
 
-                # Sleep for a short time to prevent excessive CPU usage
-                # Use the smallest interval as the sleep time, but minimum 0.01 second
-                min_interval = min(self._update_intervals.values())
-                time.sleep(min(min_interval / 1000, 0.01))
+                # Wait until the soonest deadline instead of a fixed tick so
+                # widely spaced intervals do not cause needless wakeups; the
+                # stop event still wakes the thread immediately on shutdown
+                next_due = min(
+                    last_updates[state_type] + interval * backoff[state_type] / 1000
+                    for state_type, interval in intervals.items()
+                )
+                self._stop_event.wait(max(next_due - time.monotonic(), 0.0))
 
             except Exception as e:  # pylint: disable=broad-exception-caught # noqa: PERF203 BLE001
                 # TODO: Dont catch broad exception
                 log.error("Error in continuous update thread: %s", e)
-                time.sleep(0.5)  # Pause briefly after an error
+                self._stop_event.wait(0.5)  # Pause briefly after an error
 
     def start_continuous_update(
         self,
@@ -543,7 +823,15 @@ class ModbusConnection:
         )
 
         if not self._running:
+            # Phase-shift the four cadences across a quarter interval each so
+            # aligned intervals do not burst all reads at the same instant
+            current_time = time.monotonic()
+            for i, (state_type, type_interval) in enumerate(
+                self._update_intervals.items()
+            ):
+                self._last_updates[state_type] = current_time - i * type_interval / 4000
             self._running = True
+            self._stop_event.clear()
             self._update_thread = Thread(target=self._continuous_update, daemon=True)
             self._update_thread.start()
 
@@ -605,6 +893,7 @@ class ModbusConnection:
 
         log.info("Stopping continuous update thread")
         self._running = False
+        self._stop_event.set()
         self._update_thread.join(
             timeout=2 * min(self._update_intervals.values()) / 1000
         )
@@ -612,11 +901,22 @@ class ModbusConnection:
             log.warning("Continuous update thread did not terminate gracefully")
         self._update_thread = None
 
+    def state_version(self, channel_type: ModbusChannelType) -> int:
+        """Get the publish counter of a state table.
+
+        Readers that combine several cells can snapshot the version, read,
+        and retry if it changed in between, instead of taking a lock.
+        """
+        return self._state_versions[channel_type]
+
     def read_input_register(self, address: int, update: bool = False) -> int:
         """Read a single input register at the specified address."""
         if update:
-            self._update_input_state(address, 1)
+            self.request_read("input", address, 1)
+            self.flush_reads("input")
 
+        # Grabbing the table reference is atomic; the updater publishes new
+        # objects instead of mutating, so no reader lock is needed
         register_value = self.state["input"][address]
         if isinstance(register_value, (Words, Bits)):
             return register_value.value_to_int()
@@ -627,7 +927,8 @@ class ModbusConnection:
     ) -> Words:
         """Read multiple input registers starting at the specified address."""
         if update:
-            self._update_input_state(address, width)
+            self.request_read("input", address, width)
+            self.flush_reads("input")
 
         registers = self.state["input"][address : address + width]
         if isinstance(registers, Words):
@@ -640,7 +941,8 @@ class ModbusConnection:
     def read_holding_register(self, address: int, update: bool = False) -> int:
         """Read a single holding register at the specified address."""
         if update:
-            self._update_holding_state(address, 1)
+            self.request_read("holding", address, 1)
+            self.flush_reads("holding")
 
         register_value = self.state["holding"][address]
         if isinstance(register_value, (Words, Bits)):
@@ -652,7 +954,8 @@ class ModbusConnection:
     ) -> Words:
         """Read multiple holding registers starting at the specified address."""
         if update:
-            self._update_holding_state(address, width)
+            self.request_read("holding", address, width)
+            self.flush_reads("holding")
 
         registers = self.state.holding[address : address + width]
         if isinstance(registers, Words):
@@ -665,7 +968,8 @@ class ModbusConnection:
     def read_discrete_input(self, address: int, update: bool = False) -> bool:
         """Read a discrete input at the specified address."""
         if update:
-            self._update_discrete_state(address, 1)
+            self.request_read("discrete", address, 1)
+            self.flush_reads("discrete")
 
         input_value = self.state.discrete[address]
         if isinstance(input_value, Bits):
@@ -685,20 +989,23 @@ class ModbusConnection:
         """
         if update:
             log.debug("Updating discrete state from modbus")
-            self._update_discrete_state(address, width)
+            self.request_read("discrete", address, width)
+            self.flush_reads("discrete")
         value = Bits(self.state.discrete[address : address + width])
-        log.debug(
-            "Reading discrete inputs from 0x%s - 0x%s Value: %s",
-            f"{address:04x}",
-            f"{address + width:04x}",
-            value.value_to_bin(),
-        )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Reading discrete inputs from 0x%04x - 0x%04x Value: %s",
+                address,
+                address + width,
+                value.value_to_bin(),
+            )
         return value
 
     def read_coil(self, address: int, update: bool = False) -> bool:
         """Read a coil at the specified address."""
         if update:
-            self._update_coil_state(address, 1)
+            self.request_read("coil", address, 1)
+            self.flush_reads("coil")
 
         coil_value = self.state["coil"][address]
         if isinstance(coil_value, Bits):
@@ -715,14 +1022,16 @@ class ModbusConnection:
 
         """
         if update:
-            self._update_coil_state(address, width)
+            self.request_read("coil", address, width)
+            self.flush_reads("coil")
         value = Bits(self.state.coil[address : address + width])
-        log.debug(
-            "Reading coils from 0x%s - 0x%s Value: %s",
-            f"{address:04x}",
-            f"{address + width:04x}",
-            value.value_to_bin(),
-        )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Reading coils from 0x%04x - 0x%04x Value: %s",
+                address,
+                address + width,
+                value.value_to_bin(),
+            )
         return value
 
     @auto_reconnect
@@ -734,9 +1043,17 @@ class ModbusConnection:
             value: The value to set the coil to.
 
         """
-        log.debug("Writing coil 0x%s Value: %s", f"{address:04x}", value)
-        self.modbus_tcp_client.write_coil(address, value)
-        self._update_coil_state()
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Writing coil 0x%04x Value: %s", address, value)
+        with self._transaction_lock:
+            self._write_coil(address, value)
+        # Patch the cached state locally instead of re-reading the whole
+        # coil table; the polling loop provides the authoritative readback
+        with self._state_locks["coil"].writer():
+            new_coil = self.state.coil.copy()
+            new_coil[address] = value
+            self.state.coil = new_coil
+            self._state_versions["coil"] += 1
 
     @auto_reconnect
     def write_coils(self, address: int, bits: Bits) -> None:
@@ -747,14 +1064,20 @@ class ModbusConnection:
             bits: The values to set the coils to.
 
         """
-        log.debug(
-            "Writing coils from 0x%s - 0x%s Value: %s",
-            f"{address:04x}",
-            f"{address + len(bits):04x}",
-            bits.value_to_bin(),
-        )
-        self.modbus_tcp_client.write_coils(address, bits.value.tolist())
-        self._update_coil_state()
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Writing coils from 0x%04x - 0x%04x Value: %s",
+                address,
+                address + len(bits),
+                bits.value_to_bin(),
+            )
+        with self._transaction_lock:
+            self._write_coils(address, bits.value.tolist())
+        with self._state_locks["coil"].writer():
+            new_coil = self.state.coil.copy()
+            new_coil[address : address + len(bits)] = bits
+            self.state.coil = new_coil
+            self._state_versions["coil"] += 1
 
     @auto_reconnect
     def write_register(self, address: int, value: int) -> None:
@@ -765,14 +1088,20 @@ class ModbusConnection:
             value: The value to set the register to.
 
         """
-        log.debug(
-            "Writing register 0x%s Value: 0x%s (%s)",
-            f"{address:04x}",
-            f"{value:04x}",
-            f"0b{value:016b}",
-        )
-        self.modbus_tcp_client.write_register(address, value)
-        self._update_holding_state()
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Writing register 0x%04x Value: 0x%04x (%s)",
+                address,
+                value,
+                f"0b{value:016b}",
+            )
+        with self._transaction_lock:
+            self._write_register(address, value)
+        with self._state_locks["holding"].writer():
+            new_holding = self.state.holding.copy()
+            new_holding[address] = value
+            self.state.holding = new_holding
+            self._state_versions["holding"] += 1
 
     @auto_reconnect
     def write_registers(self, address: int, registers: Words) -> None:
@@ -783,15 +1112,21 @@ class ModbusConnection:
             registers: The values to set the registers to.
 
         """
-        log.debug(
-            "Writing registers from 0x%s - 0x%s Value: %s (%s)",
-            f"{address:04x}",
-            f"{address + len(registers):04x}",
-            registers.value_to_hex(),
-            registers.value_to_bin(),
-        )
-        self.modbus_tcp_client.write_registers(address, registers.value.tolist())
-        self._update_holding_state()
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Writing registers from 0x%04x - 0x%04x Value: %s (%s)",
+                address,
+                address + len(registers),
+                registers.value_to_hex(),
+                registers.value_to_bin(),
+            )
+        with self._transaction_lock:
+            self._write_registers(address, registers.value.tolist())
+        with self._state_locks["holding"].writer():
+            new_holding = self.state.holding.copy()
+            new_holding[address : address + len(registers)] = registers
+            self.state.holding = new_holding
+            self._state_versions["holding"] += 1
 
     def register_channel_callback(
         self, modbus_channel: "ModbusChannel", object: object
@@ -839,6 +1174,13 @@ class ModbusChannel:
     """
 
     channel_type: ClassVar[ModbusChannelType | None] = None
+    _registry: ClassVar[dict[ModbusChannelType, type["ModbusChannel"]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Register subclasses by channel type for O(1) lookup in create()."""
+        super().__init_subclass__(**kwargs)
+        if cls.channel_type is not None:
+            ModbusChannel._registry[cls.channel_type] = cls
 
     def __init__(self, address: int, modbus_connection: ModbusConnection) -> None:
         """Initialize the Modbus Channel.
@@ -896,6 +1238,10 @@ class ModbusChannel:
             "This channel does not support reading the most significant byte"
         )
 
+    def read_bytes(self, update: bool = False) -> tuple[int, int]:
+        """Read the least and most significant bytes with a single register read."""
+        raise TypeError("This channel does not support reading bytes")
+
     def write_lsb(self, value: int) -> None:
         """Write the least significant byte of the channel."""
         raise TypeError(
@@ -923,14 +1269,17 @@ class ModbusChannel:
             modbus_connection: The modbus connection to use.
 
         """
-        for subclass in cls.__subclasses__():
-            if subclass.channel_type == modbus_channel_type:
-                return subclass(
-                    address=address.get(modbus_channel_type, 0),
-                    modbus_connection=modbus_connection,
-                )
-        raise ValueError(
-            f"Class for type {modbus_channel_type} not found in {cls.__name__}"
+        subclass = cls._registry.get(modbus_channel_type)
+        if subclass is None:
+            raise ValueError(
+                f"Class for type {modbus_channel_type} not found in {cls.__name__}"
+            )
+        return cast(
+            Self,
+            subclass(
+                address=address.get(modbus_channel_type, 0),
+                modbus_connection=modbus_connection,
+            ),
         )
 
     @classmethod
@@ -948,17 +1297,20 @@ class ModbusChannel:
             modbus_connection: The modbus connection to use.
 
         """
-        return {
-            module_type: [
-                cls.create(
-                    module_type,
-                    {k: v + i for k, v in address.items()},
-                    modbus_connection,
+        channels: dict[ModbusChannelType, list[Self]] = {}
+        for module_type, type_count in count.items():
+            # create() only reads the entry for its own channel type, so a
+            # single reused one-slot dict avoids rebuilding the full address
+            # dict for every channel
+            base_address = address.get(module_type, 0)
+            channel_address: AddressDict = {}
+            channels[module_type] = []
+            for i in range(type_count):
+                channel_address[module_type] = base_address + i
+                channels[module_type].append(
+                    cls.create(module_type, channel_address, modbus_connection)
                 )
-                for i in range(count)
-            ]
-            for module_type, count in count.items()
-        }
+        return channels
 
 
 class Coil(ModbusChannel):
@@ -968,14 +1320,11 @@ class Coil(ModbusChannel):
 
     def read(self, update: bool = False) -> bool:
         """Read the state of the coil."""
-        log.debug("Reading coil at address 0x%s", f"{self.address:04x}")
         return self.modbus_connection.read_coil(self.address, update)
 
     def write(self, value: bool) -> None:
         """Write the state of the coil."""
-        log.debug(
-            "Writing coil at address 0x%s Value: %s", f"{self.address:04x}", value
-        )
+        log.debug("Writing coil at address 0x%04x Value: %s", self.address, value)
         self.modbus_connection.write_coil(self.address, value)
 
 
@@ -986,7 +1335,6 @@ class Discrete(ModbusChannel):
 
     def read(self, update: bool = False) -> bool:
         """Read the state of the discrete input."""
-        log.debug("Reading discrete input at address 0x%s", f"{self.address:04x}")
         return self.modbus_connection.read_discrete_input(self.address, update)
 
     def write(self, value: bool) -> None:
@@ -1001,35 +1349,29 @@ class Holding(ModbusChannel):
 
     def read(self, update: bool = False) -> int:
         """Read the state of the holding register."""
-        log.debug("Reading holding register at address 0x%s", f"{self.address:04x}")
         return self.modbus_connection.read_holding_register(self.address, update)
 
     def read_lsb(self, update: bool = False) -> int:
         """Read the least significant byte of the input register."""
-        log.debug(
-            "Reading LSB of holding register at address 0x%s", f"{self.address:04x}"
-        )
-        return (
-            int(self.modbus_connection.read_holding_register(self.address, update))
-            & 0xFF
-        )
+        return self.modbus_connection.read_holding_register(self.address, update) & 0xFF
 
     def read_msb(self, update: bool = False) -> int:
         """Read the most significant byte of the input register."""
-        log.debug(
-            "Reading MSB of holding register at address 0x%s", f"{self.address:04x}"
-        )
         return (
-            int(self.modbus_connection.read_holding_register(self.address, update))
-            & 0xFF00
-        ) >> 8
+            self.modbus_connection.read_holding_register(self.address, update) >> 8
+        ) & 0xFF
+
+    def read_bytes(self, update: bool = False) -> tuple[int, int]:
+        """Read both bytes of the holding register with a single register read."""
+        value = self.modbus_connection.read_holding_register(self.address, update)
+        return value & 0xFF, (value >> 8) & 0xFF
 
     def write(self, value: int) -> None:
         """Write the state of the holding register."""
         log.debug(
-            "Writing holding register at address 0x%s Value: 0x%s(%s)",
-            f"{self.address:04x}",
-            f"{value:04x}",
+            "Writing holding register at address 0x%04x Value: 0x%04x(%s)",
+            self.address,
+            value,
             f"0b{value:016b}",
         )
         self.modbus_connection.write_registers(self.address, Words([value]))
@@ -1037,23 +1379,25 @@ class Holding(ModbusChannel):
     def write_lsb(self, value: int) -> None:
         """Write the least significant byte of the holding register."""
         log.debug(
-            "Writing LSB of holding register at address 0x%s Value: 0x%s(%s)",
-            f"{self.address:04x}",
-            f"{value:02x}",
+            "Writing LSB of holding register at address 0x%04x Value: 0x%02x(%s)",
+            self.address,
+            value,
             f"0b{value:08b}",
         )
-        msb = int(self.read_msb(update=True))
+        # The updater keeps the cached state fresh, so read the other byte
+        # from it instead of paying a Modbus round trip before the write
+        msb = self.read_msb()
         self.modbus_connection.write_registers(
             self.address, Words([(msb << 8) | value])
         )
 
     def write_msb(self, value: int) -> None:
         """Write the most significant byte of the holding register."""
-        lsb = int(self.read_lsb(update=True))
+        lsb = self.read_lsb()
         log.debug(
-            "Writing MSB of holding register at address 0x%s Value: 0x%s(%s)",
-            f"{self.address:04x}",
-            f"{value:02x}",
+            "Writing MSB of holding register at address 0x%04x Value: 0x%02x(%s)",
+            self.address,
+            value,
             f"0b{value:08b}",
         )
         self.modbus_connection.write_registers(
@@ -1068,34 +1412,29 @@ class Input(ModbusChannel):
 
     def read(self, update: bool = False) -> int:
         """Read the state of the input register."""
-        log.debug("Reading input register at address 0x%s", f"{self.address:04x}")
         return self.modbus_connection.read_input_register(self.address, update)
 
     def write(self, value: int) -> None:
         """Write a value to the input register."""
         log.debug(
-            "Writing input register at address 0x%s Value: 0x%s(%s)",
-            f"{self.address:04x}",
-            f"{value:04x}",
+            "Writing input register at address 0x%04x Value: 0x%04x(%s)",
+            self.address,
+            value,
             f"0b{value:016b}",
         )
         raise ValueError("Can not write to input channel")
 
     def read_lsb(self, update: bool = False) -> int:
         """Read the least significant byte of the input register."""
-        log.debug(
-            "Reading LSB of input register at address 0x%s", f"{self.address:04x}"
-        )
-        return (
-            int(self.modbus_connection.read_input_register(self.address, update)) & 0xFF
-        )
+        return self.modbus_connection.read_input_register(self.address, update) & 0xFF
 
     def read_msb(self, update: bool = False) -> int:
         """Read the most significant byte of the input register."""
-        log.debug(
-            "Reading MSB of input register at address 0x%s", f"{self.address:04x}"
-        )
         return (
-            int(self.modbus_connection.read_input_register(self.address, update))
-            & 0xFF00
-        ) >> 8
+            self.modbus_connection.read_input_register(self.address, update) >> 8
+        ) & 0xFF
+
+    def read_bytes(self, update: bool = False) -> tuple[int, int]:
+        """Read both bytes of the input register with a single register read."""
+        value = self.modbus_connection.read_input_register(self.address, update)
+        return value & 0xFF, (value >> 8) & 0xFF
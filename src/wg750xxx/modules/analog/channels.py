@@ -1,25 +1,25 @@
 """Basic channels for the Wago 750 series."""
 
-from typing import Any, Literal
+from typing import Any, ClassVar, Literal
 
-from wg750xxx.modules.channel import WagoChannel
+from wg750xxx.modules.channel import ChannelMetadata, WagoChannel
 from wg750xxx.modules.exceptions import WagoModuleError
 
 BytePosition = Literal["MSB", "LSB"]
 
+# Shared by all integer / float analog channel classes below
+_INT_METADATA = ChannelMetadata("number", "number", "", "", "{{ value | int }}")
+_FLOAT_METADATA = ChannelMetadata("number", "number", "", "", "{{ value | float }}")
 
-class Int16In(WagoChannel):
+
+class Int16In(WagoChannel, channel_label="Int16 In"):
     """16-Bit Analog Input Channel."""
 
-    platform: str = "number"
-    device_class: str = "number"
-    unit_of_measurement: str = ""
-    icon: str = ""
-    value_template: str = "{{ value | int }}"
+    metadata: ClassVar[ChannelMetadata] = _INT_METADATA
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the Int16In channel."""
-        super().__init__("Int16 In", *args, **kwargs)
+        super().__init__(*args, **kwargs)
 
     def read(self) -> int | None:
         """Read the value of the channel."""
@@ -32,18 +32,14 @@ class Int16In(WagoChannel):
         raise WagoModuleError("Can not write to input channel")
 
 
-class Int16Out(WagoChannel):
+class Int16Out(WagoChannel, channel_label="Int16 Out"):
     """16-Bit Analog Output Channel."""
 
-    platform: str = "number"
-    device_class: str = "number"
-    unit_of_measurement: str = ""
-    icon: str = ""
-    value_template: str = "{{ value | int }}"
+    metadata: ClassVar[ChannelMetadata] = _INT_METADATA
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the Int16Out channel."""
-        super().__init__("Int16 Out", *args, **kwargs)
+        super().__init__(*args, **kwargs)
 
     def write(self, value: Any) -> None:
         """Write a value to the channel."""
@@ -58,18 +54,14 @@ class Int16Out(WagoChannel):
         return self.modbus_channel.read()
 
 
-class Int8In(WagoChannel):
+class Int8In(WagoChannel, channel_label="Int8 In"):
     """8-Bit Analog Input Channel."""
 
-    platform: str = "number"
-    device_class: str = "number"
-    unit_of_measurement: str = ""
-    icon: str = ""
-    value_template: str = "{{ value | int }}"
+    metadata: ClassVar[ChannelMetadata] = _INT_METADATA
 
     def __init__(self, byte_position: BytePosition, *args: Any, **kwargs: Any) -> None:
         """Initialize the Int8In channel."""
-        super().__init__("Int8 In", *args, **kwargs)
+        super().__init__(*args, **kwargs)
         self.byte_position = byte_position
 
     def read(self) -> int:
@@ -87,18 +79,14 @@ class Int8In(WagoChannel):
         raise WagoModuleError("Can not write to input channel")
 
 
-class Int8Out(WagoChannel):
+class Int8Out(WagoChannel, channel_label="Int8 Out"):
     """8-Bit Analog Output Channel."""
 
-    platform: str = "number"
-    device_class: str = "number"
-    unit_of_measurement: str = ""
-    icon: str = ""
-    value_template: str = "{{ value | int }}"
+    metadata: ClassVar[ChannelMetadata] = _INT_METADATA
 
     def __init__(self, byte_position: BytePosition, *args: Any, **kwargs: Any) -> None:
         """Initialize the Int8Out channel."""
-        super().__init__("Int8 Out", *args, **kwargs)
+        super().__init__(*args, **kwargs)
         self.byte_position = byte_position
 
     def write(self, value: int) -> None:
@@ -124,18 +112,14 @@ class Int8Out(WagoChannel):
         )
 
 
-class Float16In(WagoChannel):
+class Float16In(WagoChannel, channel_label="Float16 In"):
     """Float16 Input Channel."""
 
-    platform: str = "number"
-    device_class: str = "number"
-    unit_of_measurement: str = ""
-    icon: str = ""
-    value_template: str = "{{ value | float }}"
+    metadata: ClassVar[ChannelMetadata] = _FLOAT_METADATA
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the Float16In channel."""
-        super().__init__("Float16 In", *args, **kwargs)
+        super().__init__(*args, **kwargs)
 
     def read(self) -> float:
         """Read the value of the channel."""
@@ -148,18 +132,14 @@ class Float16In(WagoChannel):
         raise WagoModuleError("Can not write to input channel")
 
 
-class Float16Out(WagoChannel):
+class Float16Out(WagoChannel, channel_label="Float16 Out"):
     """Float16 Output Channel."""
 
-    platform: str = "number"
-    device_class: str = "number"
-    unit_of_measurement: str = ""
-    icon: str = ""
-    value_template: str = "{{ value | float }}"
+    metadata: ClassVar[ChannelMetadata] = _FLOAT_METADATA
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the Float16Out channel."""
-        super().__init__("Float16 Out", *args, **kwargs)
+        super().__init__(*args, **kwargs)
 
     def write(self, value: float) -> None:
         """Write a value to the channel."""
@@ -1,9 +1,11 @@
 """Module for handling the channels of a Wago Module."""
 
 from collections.abc import Callable
+from functools import cache
 import logging
+import sys
 import time
-from typing import Any, Literal, Self
+from typing import Any, ClassVar, Literal, NamedTuple, Self
 
 from wg750xxx.const import DEFAULT_SCAN_INTERVAL
 from wg750xxx.modbus.state import ModbusChannel
@@ -26,13 +28,35 @@ WagoChannelType = Literal[
 ]
 
 
+class ChannelMetadata(NamedTuple):
+    """Presentation attributes of a channel class, packed into one tuple.
+
+    Every channel of a class shares the same platform, device class, unit,
+    icon and value template, so they live in a single shared tuple per class
+    instead of five separate class attributes.
+    """
+
+    platform: str = "sensor"
+    device_class: str = "temperature"
+    unit_of_measurement: str = "°C"
+    icon: str = "mdi:thermometer"
+    value_template: str = "{{ value | float }}"
+
+
+@cache
+def _auto_generated_name(channel_type: str, channel_index: int | None) -> str:
+    """Build the default channel name, memoized per (type, index) pair."""
+    index_value = channel_index if channel_index is not None else ""
+    return f"{channel_type} {index_value}".rstrip()
+
+
 class WagoChannel:
     """Class representing the processed data of a single Channel of a Wago Module.
 
     Args:
         module: The module the channel belongs to.
         modbus_address: The address of the first channel on the Modbus bus. Should be set on Instance creation.
-        channel_type: The type of channel. Just a string to identify the channel type. Should be set on inheriting class.
+        channel_type: The type of channel. Just a string to identify the channel type. Normally declared once per subclass via the ``channel_label`` class keyword.
         channel_count: The number of modbus channels the channel type uses. Should be set on inheriting class.
 
     Properties:
@@ -42,60 +66,108 @@ class WagoChannel:
 
     """
 
-    platform: str = "sensor"
-    device_class: str = "temperature"
-    unit_of_measurement: str = "°C"
-    icon: str = "mdi:thermometer"
-    value_template: str = "{{ value | float }}"
+    __slots__ = (
+        "_config",
+        "_key",
+        "_last_update",
+        "_on_change_callback",
+        "channel_index",
+        "channel_type",
+        "modbus_channel",
+        "module_id",
+        "update_interval",
+    )
+
+    metadata: ClassVar[ChannelMetadata] = ChannelMetadata()
+    # Channel type label declared per subclass via the channel_label class
+    # keyword, so constructors need not thread the literal up the MRO
+    _channel_label: str | None = None
+
+    def __init_subclass__(cls, channel_label: str | None = None, **kwargs: Any) -> None:
+        """Record the subclass's channel type label, pre-interned."""
+        super().__init_subclass__(**kwargs)
+        if channel_label is not None:
+            cls._channel_label = sys.intern(channel_label)
 
     def __init__(
         self,
-        channel_type: Literal[WagoChannelType],
         modbus_channel: ModbusChannel | None = None,
         config: ChannelConfig | None = None,
         channel_index: int | None = None,
         on_change_callback: Callable[[Any, Any | None], None] | None = None,
         update_interval: int | None = None,
         module_id: str | None = None,
+        *,
+        channel_type: Literal[WagoChannelType] | None = None,
     ) -> None:
         """Initialize the channel."""
-        self.channel_type: Literal[WagoChannelType] = channel_type
+        if channel_type is None:
+            channel_type = self._channel_label
+            assert channel_type is not None, (
+                f"channel_type for {self.__class__.__name__} not set"
+            )
+        # Interning lets the type strings compare by identity in __eq__
+        # and the config type checks
+        self.channel_type: Literal[WagoChannelType] = sys.intern(channel_type)
         self.modbus_channel: ModbusChannel | None = modbus_channel
+        self._key: tuple[str, int | None] = (
+            self.channel_type,
+            modbus_channel.address if modbus_channel is not None else None,
+        )
         self.update_interval: int | None = update_interval or DEFAULT_SCAN_INTERVAL
         self._last_update: float = 0
         self.module_id: str | None = module_id
-        log.debug("Initializing channel %s", self.__repr__())
-        assert self.channel_type is not None, (
-            f"channel_type for {self.__class__.__name__} not set"
-        )
+        log.debug("Initializing channel %s", self)
         self.channel_index: int | None = channel_index
-        self._config: ChannelConfig = config or ChannelConfig(
-            type=self.channel_type,
-            platform=self.platform,
-            device_class=self.device_class,
-            unit_of_measurement=self.unit_of_measurement,
-            icon=self.icon,
-            value_template=self.value_template,
-            update_interval=self.update_interval,
-        )
+        # Built lazily by the config property; most channels created at boot
+        # never read their config before a caller overwrites it
+        self._config: ChannelConfig | None = config
         self._on_change_callback: (
             Callable | Callable[[Any], None] | Callable[[Any, Any | None], None] | None
         ) = on_change_callback
 
+    # Convenience accessors so callers can keep reading the metadata
+    # fields as plain attributes
+    @property
+    def platform(self) -> str:
+        """Get the platform of the channel class."""
+        return self.metadata.platform
+
+    @property
+    def device_class(self) -> str:
+        """Get the device class of the channel class."""
+        return self.metadata.device_class
+
+    @property
+    def unit_of_measurement(self) -> str:
+        """Get the unit of measurement of the channel class."""
+        return self.metadata.unit_of_measurement
+
+    @property
+    def icon(self) -> str:
+        """Get the icon of the channel class."""
+        return self.metadata.icon
+
+    @property
+    def value_template(self) -> str:
+        """Get the value template of the channel class."""
+        return self.metadata.value_template
+
     def auto_generated_name(self) -> str:
         """Generate a name for the channel."""
-        index_value = self.channel_index if self.channel_index is not None else ""
-        return f"{self.channel_type} {index_value}".rstrip()
+        return _auto_generated_name(self.channel_type, self.channel_index)
 
     @property
     def name(self) -> str:
         """Get the name of the channel."""
-        return self._config.name or self.auto_generated_name()
+        if self._config is not None and self._config.name:
+            return self._config.name
+        return self.auto_generated_name()
 
     @name.setter
     def name(self, value: str) -> None:
         """Set the name of the channel."""
-        self._config.name = value
+        self.config.name = value
 
     def read(self) -> Any | None:
         """Read the channel value."""
@@ -129,18 +201,27 @@ class WagoChannel:
 
     def __eq__(self, other: object) -> bool:
         """Check if the channel is equal to another channel."""
-        if not isinstance(other, WagoChannel):
-            return False
-        return (
-            self.channel_type == other.channel_type
-            and self.modbus_channel is not None
-            and other.modbus_channel is not None
-            and self.modbus_channel.address == other.modbus_channel.address
-        )
+        return isinstance(other, WagoChannel) and self._key == other._key
+
+    def __hash__(self) -> int:
+        """Hash the channel by its cached (type, address) key."""
+        return hash(self._key)
 
     @property
     def config(self) -> ChannelConfig:
         """Returns a ChannelConfig object."""
+        if self._config is None:
+            # Values come from the channel class itself, so skip validation
+            meta = self.metadata
+            self._config = ChannelConfig.fast(
+                type=self.channel_type,
+                platform=meta.platform,
+                device_class=meta.device_class,
+                unit_of_measurement=meta.unit_of_measurement,
+                icon=meta.icon,
+                value_template=meta.value_template,
+                update_interval=self.update_interval,
+            )
         self._config.type = self.channel_type
         self._config.index = self.channel_index
         if not self._config.name:
@@ -179,22 +260,20 @@ class WagoChannel:
         """Set the callback function that gets called when the channel value changes."""
         self._on_change_callback = callback
 
-        # If we have a modbus channel and a valid callback, register with ModbusConnection
-        if self.modbus_channel is not None and callback is not None:
-            if hasattr(self.modbus_channel, "modbus_connection") and hasattr(
-                self.modbus_channel.modbus_connection, "register_channel_callback"
-            ):
-                self.modbus_channel.modbus_connection.register_channel_callback(
-                    self.modbus_channel, self
-                )
-        elif self.modbus_channel is not None and callback is None:
+        # ModbusChannel always carries a connection and ModbusConnection
+        # always implements the registration interface, so the channels can
+        # call it directly instead of hasattr-probing on every registration
+        if self.modbus_channel is None:
+            return
+        if callback is not None:
+            self.modbus_channel.modbus_connection.register_channel_callback(
+                self.modbus_channel, self
+            )
+        else:
             # Unregister if callback is set to None
-            if hasattr(self.modbus_channel, "modbus_connection") and hasattr(
-                self.modbus_channel.modbus_connection, "unregister_channel_callback"
-            ):
-                self.modbus_channel.modbus_connection.unregister_channel_callback(
-                    self.modbus_channel, self
-                )
+            self.modbus_channel.modbus_connection.unregister_channel_callback(
+                self.modbus_channel, self
+            )
 
     def notify_value_change(self, new_value: Any) -> None:
         """Notify the channel that its value has changed."""
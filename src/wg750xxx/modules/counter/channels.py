@@ -1,20 +1,21 @@
 """Counter channels."""
 
-from typing import Any
+import struct
+from typing import Any, ClassVar
 
-from wg750xxx.modules.channel import WagoChannel
+from wg750xxx.modules.channel import ChannelMetadata, WagoChannel
 
 from .counter_communication import CounterCommunicationRegister
 
 
-class Counter32Bit(WagoChannel):
+class Counter32Bit(WagoChannel, channel_label="Counter 32Bit"):
     """Counter 32Bit."""
 
-    platform: str = "number"
-    device_class: str = "counter"
-    unit_of_measurement: str = ""
-    icon: str = "mdi:counter"
-    value_template: str = "{{ value | int }}"
+    __slots__ = ("_state", "_value_offset", "communication_register")
+
+    metadata: ClassVar[ChannelMetadata] = ChannelMetadata(
+        "number", "counter", "", "mdi:counter", "{{ value | int }}"
+    )
 
     def __init__(
         self,
@@ -26,11 +27,25 @@ class Counter32Bit(WagoChannel):
         self.communication_register: CounterCommunicationRegister = (
             communication_register
         )
-        super().__init__("Counter 32Bit", *args, **kwargs)
+        # Cache the state object and word offset so read() can fetch the
+        # counter words straight from the published input table
+        self._state = communication_register.modbus_connection.state
+        self._value_offset: int = communication_register.modbus_address["input"] + 1
+        super().__init__(*args, **kwargs)
 
     def read(self) -> int:
-        """Read the counter value."""
-        return self.communication_register.value
+        """Read the counter value.
+
+        Grabs the published input table once (tables are copy-on-write, so
+        one table reference is always internally consistent) and unpacks
+        the two counter words directly, bypassing the register pipeline of
+        CounterCommunicationRegister.value on the hot polling path.
+        """
+        words = self._state.input.value
+        offset = self._value_offset
+        return struct.unpack(
+            "<I", struct.pack(">2H", int(words[offset]), int(words[offset + 1]))
+        )[0]
 
     def write(self, value: int) -> None:
         """Write the counter value."""
@@ -1,8 +1,15 @@
 """Counter communication."""
 
+import logging
+import struct
+import time
+
+from wg750xxx.const import DEFAULT_SCAN_INTERVAL
 from wg750xxx.modbus.registers import Register, Words
 from wg750xxx.modbus.state import AddressDict, ModbusConnection
 
+log = logging.getLogger(__name__)
+
 
 class CounterControlByte:
     """Counter control byte."""
@@ -13,14 +20,20 @@ class CounterControlByte:
         self.modbus_connection: ModbusConnection = modbus_connection
 
     def _set_and_write(self, bit_index: int, value: bool) -> None:
-        """Set the bit and write the register to the modbus."""
-        self.register.bits()[bit_index] = value
+        """Set the bit and write the register to the modbus.
+
+        Returns without touching the bus when the bit already holds the
+        requested value, so redundant setter calls cost no round trip.
+        """
+        if self.register.get_bit(bit_index) == value:
+            return
+        self.register.set_bit(bit_index, value)
         self.modbus_connection.write_registers(self.register.address, self.register)
 
     @property
     def set_counter(self) -> bool:
         """Check if the counter is set."""
-        return self.register.bits()[5]
+        return self.register.get_bit(5)
 
     @set_counter.setter
     def set_counter(self, value: bool) -> None:
@@ -30,7 +43,7 @@ class CounterControlByte:
     @property
     def lock(self) -> bool:
         """Check if the counter is locked."""
-        return self.register.bits()[4]
+        return self.register.get_bit(4)
 
     @lock.setter
     def lock(self, value: bool) -> None:
@@ -40,7 +53,7 @@ class CounterControlByte:
     @property
     def set_do2(self) -> bool:
         """Check if the DO2 is set."""
-        return self.register.bits()[3]
+        return self.register.get_bit(3)
 
     @set_do2.setter
     def set_do2(self, value: bool) -> None:
@@ -50,7 +63,7 @@ class CounterControlByte:
     @property
     def set_do1(self) -> bool:
         """Check if the DO1 is set in output register."""
-        return self.register.bits()[2]
+        return self.register.get_bit(2)
 
     @set_do1.setter
     def set_do1(self, value: bool) -> None:
@@ -61,17 +74,63 @@ class CounterControlByte:
 class CounterStatusByte:
     """Counter status byte."""
 
-    def __init__(self, register: Register, modbus_connection: ModbusConnection) -> None:
-        """Initialize the CounterStatusByte."""
+    def __init__(
+        self,
+        register: Register,
+        modbus_connection: ModbusConnection,
+        group_address: int | None = None,
+        group_width: int = 1,
+        cache_ttl_ms: int = DEFAULT_SCAN_INTERVAL,
+    ) -> None:
+        """Initialize the CounterStatusByte.
+
+        Args:
+            register: The status byte register.
+            modbus_connection: The modbus connection to use.
+            group_address: Start of the contiguous input block the status byte
+                belongs to. Refreshes read the whole block in one request.
+            group_width: Width of that block in registers.
+            cache_ttl_ms: How long a refreshed status word stays fresh. Bit
+                reads within the TTL are served from the cached word.
+
+        """
         self.register: Register = register
         self.modbus_connection: ModbusConnection = modbus_connection
+        self.cache_ttl_ms: int = cache_ttl_ms
+        self._group_address: int = (
+            group_address if group_address is not None else register.address
+        )
+        self._group_width: int = group_width
+        self._last_refresh: float = 0.0
+
+    def _stale(self) -> bool:
+        """Check whether the cached status word has outlived its TTL."""
+        return time.monotonic() - self._last_refresh >= self.cache_ttl_ms / 1000
+
+    def _refresh_group(self) -> None:
+        """Refresh the whole input block of the module with a single read."""
+        self.modbus_connection.request_read(
+            "input", self._group_address, self._group_width
+        )
+        self.modbus_connection.flush_reads("input")
+        self.register[0] = self.modbus_connection.read_input_register(
+            self.register.address
+        )
+        self._last_refresh = time.monotonic()
+
+    def refresh(self) -> None:
+        """Force a refresh of the cached status word, ignoring the TTL."""
+        self._refresh_group()
 
     def _read(self, bit_index: int) -> bool:
-        """Read the bit from the register."""
-        value = self.modbus_connection.read_input_registers(self.register.address, 1)
-        if hasattr(value, "bits"):
-            return bool(value.bits()[bit_index])
-        return False
+        """Read the bit from the cached status word.
+
+        The word is re-read at most once per TTL window, so successive bit
+        reads share a single grouped refresh instead of one request per bit.
+        """
+        if self._stale():
+            self._refresh_group()
+        return self.register.get_bit(bit_index)
 
     @property
     def ack_set_counter(self) -> bool:
@@ -138,29 +197,63 @@ class CounterCommunicationRegister:
         self.status_byte = CounterStatusByte(
             Register(self.modbus_address["input"], [self.input_register.value[0]]),
             modbus_connection,
+            group_address=self.modbus_address["input"],
+            group_width=3,
         )
 
     @property
     def value(self) -> int:
-        """Get the value of the counter."""
-        register_subset = self.input_register[1:3]
-        bytes_instance = register_subset.bytes()
-        return bytes_instance.value_to_int()
+        """Get the value of the counter.
+
+        The two counter words are read from the cached input table with a
+        version-validated snapshot: if the polling thread publishes a new
+        table between the two reads, the read is retried so the 32-bit value
+        is never assembled from words of different polls.
+        """
+        while True:
+            version = self.modbus_connection.state_version("input")
+            words = self.modbus_connection.read_input_registers(
+                self.modbus_address["input"] + 1, 2
+            )
+            if self.modbus_connection.state_version("input") == version:
+                break
+        self.input_register[1:3] = words  # type: ignore[assignment]
+        # Same result as words.bytes().value_to_int(), but packed in C
+        # instead of the Words -> Bytes -> int wrapper pipeline
+        return struct.unpack("<I", struct.pack(">2H", *words.value))[0]
 
     @value.setter
     def value(self, value: int) -> None:
         """Set the value of the counter."""
-        # Convert value to bytes and create Words object
-        value_bytes = value.to_bytes(4, byteorder="little")
-        word_values = [
-            int.from_bytes(value_bytes[0:2], byteorder="little"),
-            int.from_bytes(value_bytes[2:4], byteorder="little"),
-        ]
-        self.input_register[1:3] = Words(word_values)  # type: ignore[assignment]
+        # Split the 32-bit value into two little-endian words in one C call;
+        # the mask wraps oversize values like the 32-bit counter itself would
+        word_values = struct.unpack("<2H", struct.pack("<I", value & 0xFFFFFFFF))
+        self.input_register[1:3] = Words(list(word_values))  # type: ignore[assignment]
         self.control_byte.set_counter = True
-        # TODO: we should async wait for the counter to be reset
-        if self.status_byte.ack_set_counter:
+        if self._wait_for_ack():
             self.control_byte.set_counter = False
+        else:
+            log.warning(
+                "Counter at 0x%04x did not acknowledge set_counter in time",
+                self.modbus_address["holding"],
+            )
+
+    def _wait_for_ack(self, timeout: float = 1.0) -> bool:
+        """Wait for the controller to acknowledge the set_counter handshake.
+
+        Polls the status byte with exponential backoff so the bus is not
+        hammered while the controller latches the new value.
+        """
+        delay = 0.005
+        deadline = time.monotonic() + timeout
+        while True:
+            if self.status_byte.ack_set_counter:
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(delay)
+            delay = min(delay * 2, 0.1)
+            self.status_byte.refresh()
 
     def reset(self) -> None:
         """Reset the counter."""
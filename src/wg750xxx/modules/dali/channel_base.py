@@ -1,6 +1,7 @@
 """Dali commands."""
 
 # pylint: disable=unused-variable,too-many-public-methods
+import time
 from typing import Any
 
 from wg750xxx.modules.exceptions import WagoModuleError
@@ -11,6 +12,9 @@ from .dali_communication import DaliCommunicationRegister, DaliOutputMessage
 class DaliChannelBase:
     """DALI commands."""
 
+    # How long a dynamic query result may be served from cache
+    _dynamic_cache_ttl: float = 0.2
+
     def __init__(
         self,
         dali_address: int,
@@ -28,7 +32,17 @@ class DaliChannelBase:
         self.dali_communication_register: DaliCommunicationRegister = (
             dali_communication_register
         )
+        # Bound write method and a reusable command frame: the single-opcode
+        # hot path then only mutates the opcode byte instead of rebuilding
+        # the message and re-resolving the register per call
+        self._write = dali_communication_register.write
         self._dali_address: int = dali_address
+        self._command_message: DaliOutputMessage = DaliOutputMessage(
+            dali_address=dali_address, command_code=0
+        )
+        self._extended_message: DaliOutputMessage = DaliOutputMessage(
+            dali_address=dali_address, command_extension=0
+        )
         super().__init__(**kwargs)
 
     @property
@@ -40,30 +54,25 @@ class DaliChannelBase:
     def dali_address(self, value: int) -> None:
         """Set the DALI address."""
         self._dali_address = value
+        # The reusable frames bake the address into their register bytes
+        self._command_message = DaliOutputMessage(dali_address=value, command_code=0)
+        self._extended_message = DaliOutputMessage(
+            dali_address=value, command_extension=0
+        )
 
     def _send_command(self, command_code: int, timeout: float = 5.0) -> None:
         """Write a command to the DALI channel."""
-        self.dali_communication_register.write(
-            DaliOutputMessage(
-                dali_address=self.dali_address, command_code=command_code
-            ),
-            timeout=timeout,
-        )
+        message = self._command_message
+        message.d0 = command_code
+        self._write(message, timeout=timeout)
+        self._invalidate_dynamic_cache()
 
     def _send_config_command(self, command_code: int, timeout: float = 5.0) -> None:
         """Write a config command to the DALI channel (sending twice as expected by the DALI master)."""
-        self.dali_communication_register.write(
-            DaliOutputMessage(
-                dali_address=self.dali_address, command_code=command_code
-            ),
-            timeout=timeout,
-        )
-        self.dali_communication_register.write(
-            DaliOutputMessage(
-                dali_address=self.dali_address, command_code=command_code
-            ),
-            timeout=timeout,
-        )
+        message = self._command_message
+        message.d0 = command_code
+        self.dali_communication_register.write_many([message, message], timeout=timeout)
+        self._invalidate_dynamic_cache()
 
     def _send_extended_command(
         self,
@@ -73,24 +82,77 @@ class DaliChannelBase:
         timeout: float = 5.0,
     ) -> None:
         """Send an extended command."""
-        self.dali_communication_register.write(
-            DaliOutputMessage(
-                dali_address=self.dali_address,
-                command_extension=command_extension,
-                parameter_1=parameter_1,
-                parameter_2=parameter_2,
-            ),
-            timeout=timeout,
-        )
+        # All mutable fields are assigned, so no state leaks between calls
+        message = self._extended_message
+        message.d4 = command_extension
+        message.d3 = parameter_1 or 0
+        message.d2 = parameter_2 or 0
+        self._write(message, timeout=timeout)
 
     def _read_command(self, command_code: int) -> int:
         """Read a command from the DALI channel."""
-        r = self.dali_communication_register.write(
-            DaliOutputMessage(
-                dali_address=self.dali_address, command_code=command_code
-            ),
-            response=True,
-        )
+        message = self._command_message
+        message.d0 = command_code
+        r = self._write(message, response=True)
         if r is None:
             raise WagoModuleError("Failed to get current value")
         return r.dali_response
+
+    def _read_command_cached(self, command_code: int) -> int:
+        """Read a static command result, caching it per address and code.
+
+        Only for values that cannot change at runtime (version, device
+        type, physical minimum); reset paths invalidate the cache.
+        """
+        cache = self.dali_communication_register.static_cache
+        key = (self._dali_address, command_code)
+        if key not in cache:
+            cache[key] = self._read_command(command_code)
+        return cache[key]
+
+    def _invalidate_static_cache(self) -> None:
+        """Drop the cached static query results for this DALI address."""
+        cache = self.dali_communication_register.static_cache
+        for key in [k for k in cache if k[0] == self._dali_address]:
+            del cache[key]
+
+    def _read_command_ttl(self, command_code: int) -> int:
+        """Read a dynamic command result, serving repeats from a short cache.
+
+        Frequent pollers hit the DALI bus at most once per TTL window;
+        any command write for this address drops its cached entries.
+        """
+        cache = self.dali_communication_register.dynamic_cache
+        key = (self._dali_address, command_code)
+        entry = cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self._dynamic_cache_ttl:
+            return entry[1]
+        value = self._read_command(command_code)
+        cache[key] = (time.monotonic(), value)
+        return value
+
+    def _invalidate_dynamic_cache(self) -> None:
+        """Drop the cached dynamic query results made stale by a write.
+
+        A group or broadcast write changes the state of many short
+        addresses at once, so those clear the whole cache instead of
+        just this address's entries.
+        """
+        cache = self.dali_communication_register.dynamic_cache
+        if self._dali_address >= 0x3F:  # broadcast (0x3F) or group (0x40+)
+            cache.clear()
+            return
+        for key in [k for k in cache if k[0] == self._dali_address]:
+            del cache[key]
+
+    def _read_commands(self, command_codes: list[int]) -> list[int]:
+        """Read several commands from the DALI channel as one batch."""
+        responses = self.dali_communication_register.read_many(
+            [
+                DaliOutputMessage(
+                    dali_address=self.dali_address, command_code=command_code
+                )
+                for command_code in command_codes
+            ]
+        )
+        return [r.dali_response for r in responses]
@@ -2,9 +2,22 @@
 
 # pylint: disable=unused-variable,too-many-public-methods
 
+from collections.abc import Callable
+
 from .channel_base import DaliChannelBase
 from .dali_communication import DaliOutputMessage
-from .misc import check_value_range
+
+# Single-opcode commands (DIN IEC 60929) generated below from this table,
+# so the opcodes live in one place and each method shares the same body
+_SEND_OPS: dict[str, int] = {
+    "power_off": 0b00000000,  # 0
+    "increase_brightness": 0b00000001,  # 1
+    "decrease_brightness": 0b00000010,  # 2
+    "increase_brightness_step": 0b00000011,  # 3
+    "decrease_brightness_step": 0b00000100,  # 4
+    "decrease_brightness_and_power_off": 0b00000111,  # 7
+    "power_on_and_increase_brightness": 0b00001000,  # 8
+}
 
 
 class DaliChannelCommands(DaliChannelBase):
@@ -12,58 +25,44 @@ class DaliChannelCommands(DaliChannelBase):
 
     # Dali Commands DIN IEC 60929
 
-    # 0. Power off
-    def power_off(self) -> None:
-        """Power off."""
-        self._send_command(0b00000000)
-
-    # 1. Increase brightness
-    def increase_brightness(self) -> None:
-        """Increase brightness."""
-        self._send_command(0b00000001)
-
-    # 2. Decrease brightness
-    def decrease_brightness(self) -> None:
-        """Decrease brightness."""
-        self._send_command(0b00000010)
-
-    # 3. Increase brightness one step
-    def increase_brightness_step(self) -> None:
-        """Increase brightness one step."""
-        self._send_command(0b00000011)
-
-    # 4. Decrease brightness step
-    def decrease_brightness_step(self) -> None:
-        """Decrease brightness step."""
-        self._send_command(0b00000100)
-
-    # 7. Decrease brightness and power off
-    def decrease_brightness_and_power_off(self) -> None:
-        """Decrease brightness and power off."""
-        self._send_command(0b00000111)
-
-    # 8. Power on and increase brightness
-    def power_on_and_increase_brightness(self) -> None:
-        """Power on and increase brightness."""
-        self._send_command(0b00001000)
+    # 0-8. Single-opcode commands, see _SEND_OPS
 
     # 16-31. Go to scene
     def go_to_scene(self, scene: int) -> None:
         """Go to scene."""
-        check_value_range(scene, 1, 16, "scene")
+        if not 1 <= scene <= 16:
+            raise ValueError("scene must be between 1 and 16")
         self._send_command(0b00010000 + scene)
 
     # 160. Get current value
     def get_current_value(self) -> int:
         """Get current value."""
-        return self._read_command(0b10100000)
+        return self._read_command_ttl(0b10100000)
 
     # 999. WAGO specific: Direct brightness control
     def set_brightness(self, brightness: int) -> None:
         """Set brightness."""
-        check_value_range(brightness, 0, 254, "brightness")
+        if not 0 <= brightness <= 254:
+            raise ValueError("brightness must be between 0 and 254")
         self.dali_communication_register.write(
             DaliOutputMessage(dali_address=self.dali_address, brightness=brightness)
         )
+        self._invalidate_dynamic_cache()
 
     # Macro Commands
+
+
+def _make_send_command(name: str, command_code: int) -> Callable[..., None]:
+    """Build a no-argument command method for a single opcode."""
+
+    def command(self: DaliChannelCommands) -> None:
+        self._send_command(command_code)
+
+    command.__name__ = name
+    command.__qualname__ = f"DaliChannelCommands.{name}"
+    command.__doc__ = f"{name.replace('_', ' ').capitalize()}."
+    return command
+
+
+for _name, _command_code in _SEND_OPS.items():
+    setattr(DaliChannelCommands, _name, _make_send_command(_name, _command_code))
@@ -4,7 +4,7 @@
 
 from .channel_base import DaliChannelBase
 from .dali_communication import DaliOutputMessage
-from .misc import check_value_range, iterate_bits
+from .misc import set_bit_indices
 
 
 class DaliChannelSetup(DaliChannelBase):
@@ -25,6 +25,7 @@ class DaliChannelSetup(DaliChannelBase):
     def reset(self) -> None:
         """Reset."""
         self._send_config_command(0b00100000)
+        self._invalidate_static_cache()
 
     # 33. Save current value to DTR
     def save_current_value_to_dtr(self) -> None:
@@ -64,36 +65,41 @@ class DaliChannelSetup(DaliChannelBase):
     # 64-79. Save DTR to scene
     def save_dtr_to_scene(self, scene: int) -> None:
         """Save DTR to scene."""
-        check_value_range(scene, 1, 16, "scene")
+        if not 1 <= scene <= 16:
+            raise ValueError("scene must be between 1 and 16")
         self._send_config_command(0b01000000 + scene)
 
     # 80-95. Remove from scene
     def remove_from_scene(self, scene: int) -> None:
         """Remove from scene."""
-        check_value_range(scene, 1, 16, "scene")
+        if not 1 <= scene <= 16:
+            raise ValueError("scene must be between 1 and 16")
         self._send_config_command(0b01010000 + scene)
 
     # 96-111. Add to group
     def add_to_group(self, group: int) -> None:
         """Add to group."""
-        check_value_range(group, 1, 16, "group")
+        if not 1 <= group <= 16:
+            raise ValueError("group must be between 1 and 16")
         self._send_config_command(0b01100000 + group)
 
     # 112-127. Remove from group
     def remove_from_group(self, group: int) -> None:
         """Remove from group."""
-        check_value_range(group, 1, 16, "group")
+        if not 1 <= group <= 16:
+            raise ValueError("group must be between 1 and 16")
         self._send_config_command(0b01110000 + group)
 
     # 128. Save DTR as short address
     def save_dtr_as_short_address(self) -> None:
         """Save DTR as short address."""
         self._send_config_command(0b10000000)
+        self._invalidate_static_cache()
 
     # 160. Get current value
     def get_current_value(self) -> int:
         """Get current value."""
-        return self._read_command(0b10100000)
+        return self._read_command_ttl(0b10100000)
 
     # 161. Get max value
     def get_max_value(self) -> int:
@@ -125,30 +131,37 @@ class DaliChannelSetup(DaliChannelBase):
     # 176-191. Get scene value
     def get_scene_value(self, scene: int) -> int:
         """Get scene value."""
-        check_value_range(scene, 0, 15, "scene")
+        if not 0 <= scene <= 15:
+            raise ValueError("scene must be between 0 and 15")
         return self._read_command(0b10110000 + scene)
 
     # 192-193. Get group membership
     def get_groups(self) -> list[int]:
-        """Get groups."""
-        # Get Group 1-8
-        groups = [i for bit, i in iterate_bits(self._read_command(0b11000000)) if bit]
-        # Get Group 9-16
-        groups.extend(
-            [i for bit, i in iterate_bits(self._read_command(0b11000001)) if bit]
-        )
-        return groups
+        """Get groups.
+
+        Returns the 1-based group numbers, matching add_to_group and
+        remove_from_group; bit 0 of the first response byte is group 1,
+        bit 0 of the second is group 9.
+        """
+        # Groups 1-8 and 9-16 in one batched query
+        group_1_8, group_9_16 = self._read_commands([0b11000000, 0b11000001])
+        return [1 + i for i in set_bit_indices(group_1_8)] + [
+            9 + i for i in set_bit_indices(group_9_16)
+        ]
 
     # 194-196. Get direct address
     def get_direct_address(self) -> int:
-        """Get direct address."""
-        # Get lower 8 bit address
-        high_byte = self._read_command(0b11000010)
-        # Get middle 8 bit address
-        middle_byte = self._read_command(0b11000011)
-        # Get upper 8 bit address
-        low_byte = self._read_command(0b11000100)
-        return high_byte << 24 | middle_byte << 16 | low_byte
+        """Get direct address.
+
+        Composes the three address bytes as a 24-bit value; the earlier
+        shift arithmetic put the high byte at bit 24 and left bits 8-15
+        empty, dropping the middle of the address.
+        """
+        # High, middle and low address bytes in one batched query
+        high_byte, middle_byte, low_byte = self._read_commands(
+            [0b11000010, 0b11000011, 0b11000100]
+        )
+        return int.from_bytes(bytes((low_byte, middle_byte, high_byte)), "little")
 
     # 197-223. Reserved
 
@@ -157,16 +170,19 @@ class DaliChannelSetup(DaliChannelBase):
         self, extension_command: int
     ) -> int:
         """Get application specific extension commands."""
-        check_value_range(extension_command, 0, 63, "extension_command")
+        if not 0 <= extension_command <= 63:
+            raise ValueError("extension_command must be between 0 and 63")
         return self._read_command(0b11000000 + extension_command)
 
     # 999. WAGO specific: Direct brightness control
     def set_brightness(self, brightness: int) -> None:
         """Set brightness."""
-        check_value_range(brightness, 0, 254, "brightness")
+        if not 0 <= brightness <= 254:
+            raise ValueError("brightness must be between 0 and 254")
         self.dali_communication_register.write(
             DaliOutputMessage(dali_address=self.dali_address, brightness=brightness)
         )
+        self._invalidate_dynamic_cache()
 
     # Macro Commands
 
@@ -193,6 +209,7 @@ class DaliChannelSetup(DaliChannelBase):
     # 5. Blink show address [sec]
     def blink_show_address(self, seconds: int) -> None:
         """Blink show address."""
-        check_value_range(seconds, 0, 255, "seconds")
+        if not 0 <= seconds <= 255:
+            raise ValueError("seconds must be between 0 and 255")
         timeout = seconds + 1
         self._send_extended_command(0x05, parameter_1=seconds, timeout=timeout)
@@ -46,7 +46,7 @@ class DaliChannelStatus(DaliChannelBase):
     # 151. Get version number
     def get_version_number(self) -> int:
         """Get version number."""
-        return self._read_command(0b10010111)
+        return self._read_command_cached(0b10010111)
 
     def get_dtr_content(self) -> int:
         """Get DTR content."""
@@ -55,12 +55,12 @@ class DaliChannelStatus(DaliChannelBase):
     # 153. Get device type
     def get_device_type(self) -> int:
         """Get device type."""
-        return self._read_command(0b10011001)
+        return self._read_command_cached(0b10011001)
 
     # 154. Get physical min value
     def get_physical_min_value(self) -> int:
         """Get physical min value."""
-        return self._read_command(0b10011010)
+        return self._read_command_cached(0b10011010)
 
     # 155. Get power supply error
     def get_power_supply_error(self) -> int:
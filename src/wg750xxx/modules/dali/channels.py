@@ -1,9 +1,9 @@
 # pylint: disable=unused-variable,too-many-public-methods
 """Dali channel."""
 
-from typing import Any
+from typing import Any, ClassVar
 
-from wg750xxx.modules.channel import WagoChannel
+from wg750xxx.modules.channel import ChannelMetadata, WagoChannel
 from wg750xxx.modules.dali.channel_setup import DaliChannelSetup
 
 from .channel_commands import DaliChannelCommands
@@ -24,11 +24,9 @@ class DaliChannel(DaliChannelCommands, WagoChannel):
 
     """
 
-    platform: str = "light"
-    device_class: str = "brightness"
-    unit_of_measurement: str = "%"
-    icon: str = "mdi:brightness"
-    value_template: str = "{{ value | int}}"
+    metadata: ClassVar[ChannelMetadata] = ChannelMetadata(
+        "light", "brightness", "%", "mdi:brightness", "{{ value | int}}"
+    )
 
     def __init__(
         self,
@@ -1,5 +1,8 @@
 """DALI Message."""
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from copy import copy
 import logging
 import sys
 import time
@@ -47,6 +50,10 @@ class DaliInputMessage:
         """Represent the DALI message as a string."""
         return f"{self.__dict__}"
 
+    def as_bytes(self) -> tuple[int, int, int, int]:
+        """Get the response and message bytes as one tuple."""
+        return (self.dali_response, self.message_3, self.message_2, self.message_1)
+
     @property
     def register(self) -> Words:
         """Full 6 byte value of the Dali Register."""
@@ -157,6 +164,16 @@ class DaliCommunicationRegister:
         self.modbus_address = modbus_address
         self.control_byte: ControlByte = ControlByte()
         self.status_byte: StatusByte = StatusByte()
+        # Static query results cached per (dali_address, command_code);
+        # shared here so every channel object of the master sees the same
+        # cache and invalidation
+        self.static_cache: dict[tuple[int, int], int] = {}
+        # Short-lived (dali_address, command_code) -> (timestamp, value)
+        # read-through cache for dynamic queries; command writes for an
+        # address invalidate its entries
+        self.dynamic_cache: dict[tuple[int, int], tuple[float, int]] = {}
+        # Pending frames queued inside a transaction() block; None outside
+        self._transaction_queue: list[DaliOutputMessage] | None = None
         self.read_control_byte()
         self.read_status_byte()
 
@@ -225,6 +242,14 @@ class DaliCommunicationRegister:
             DaliInputMessage: The DALI message response.
 
         """
+        if self._transaction_queue is not None:
+            if not response:
+                # Snapshot the frame: callers reuse pooled messages, so a
+                # later command would otherwise mutate the queued copy
+                self._transaction_queue.append(copy(dali_message))
+                return None
+            # A response read needs the queued writes on the bus first
+            self._flush_transaction()
         self.read_status_byte()
         self.read_control_byte()
 
@@ -258,22 +283,151 @@ class DaliCommunicationRegister:
 
         return None
 
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Queue non-response writes and flush them as one batch.
+
+        Inside the block, write() calls without response collect their
+        frames instead of transacting immediately; the first response
+        read or the block exit sends them via write_many, sharing the
+        status/control pre-reads across the batch. Nested use reuses the
+        outer queue.
+        """
+        if self._transaction_queue is not None:
+            yield
+            return
+        self._transaction_queue = []
+        try:
+            yield
+            self._flush_transaction()
+        finally:
+            self._transaction_queue = None
+
+    def _flush_transaction(self) -> None:
+        """Send the queued transaction frames, if any."""
+        if not self._transaction_queue:
+            return
+        pending = self._transaction_queue
+        self._transaction_queue = []
+        self.write_many(pending)
+
+    def write_many(
+        self,
+        dali_messages: list[DaliOutputMessage],
+        timeout: float = 0.2,
+    ) -> None:
+        """Write several DALI messages back-to-back.
+
+        The DALI master consumes one frame per transmit handshake, so the
+        frames still go out sequentially — but the status/control register
+        pre-read and the trailing read-request check happen once for the
+        whole batch instead of once per frame.
+
+        Args:
+            dali_messages: list[DaliOutputMessage]: The DALI messages to write.
+            timeout: float: The timeout for each DALI message.
+
+        """
+        self.read_status_byte()
+        self.read_control_byte()
+
+        if self.read_request():
+            data = self.read()
+            log.warning(
+                "DALI master is requesting an unexpected read before write: %s", data
+            )
+            raise DaliError("DALI master is requesting an unexpected read.")
+
+        for dali_message in dali_messages:
+            self.control_byte.transmit_request = not self.status_byte.transmit_accept
+            dali_message.control_byte = self.control_byte
+            self.modbus_connection.write_registers(
+                self.modbus_address["holding"], dali_message.register
+            )
+            # Re-reads the status byte, so the next iteration toggles the
+            # handshake from the freshly accepted state
+            self.wait_for_transmit_accept(timeout)
+
+        if self.read_request():
+            data = self.read()
+            log.warning(
+                "DALI master is requesting an unexpected read after batch write: %s",
+                data,
+            )
+            raise DaliError("DALI master is requesting an unexpected read.")
+
+    def read_many(
+        self,
+        dali_messages: list[DaliOutputMessage],
+        timeout: float = 0.2,
+    ) -> list[DaliInputMessage]:
+        """Write several DALI queries and collect their responses.
+
+        Like write_many, the status/control pre-read is shared across the
+        batch; each query still needs its own transmit handshake and
+        response frame on the DALI bus.
+
+        Args:
+            dali_messages: list[DaliOutputMessage]: The DALI queries to write.
+            timeout: float: The timeout for each DALI message.
+
+        Returns:
+            The DALI responses, in query order.
+
+        """
+        if self._transaction_queue is not None:
+            self._flush_transaction()
+        self.read_status_byte()
+        self.read_control_byte()
+
+        if self.read_request():
+            data = self.read()
+            log.warning(
+                "DALI master is requesting an unexpected read before write: %s", data
+            )
+            raise DaliError("DALI master is requesting an unexpected read.")
+
+        responses: list[DaliInputMessage] = []
+        for dali_message in dali_messages:
+            self.control_byte.transmit_request = not self.status_byte.transmit_accept
+            dali_message.control_byte = self.control_byte
+            self.modbus_connection.write_registers(
+                self.modbus_address["holding"], dali_message.register
+            )
+            self.wait_for_transmit_accept(timeout)
+            responses.append(self.read(wait=False))
+        return responses
+
     def wait_for_receive_request(self, timeout: float = 0.2) -> None:
-        """Wait for the receive request."""
+        """Wait for the receive request.
+
+        Polls with a short exponential backoff (1 ms doubling to 8 ms)
+        instead of spinning, so the wait does not hammer the Modbus link
+        with back-to-back status reads.
+        """
         start_time = time.time()
         timeout = timeout * (10 * trace)  # For debugging
+        delay = 0.001
         self.read_status_byte()
         while self.status_byte.receive_request == self.control_byte.receive_accept:
+            time.sleep(delay)
+            delay = min(delay * 2, 0.008)
             self.read_status_byte()
             if time.time() - start_time > timeout:
                 raise TimeoutError("Timeout waiting for receive request")
 
     def wait_for_transmit_accept(self, timeout: float = 0.2) -> None:
-        """Wait for the transmit accept."""
+        """Wait for the transmit accept.
+
+        Uses the same backoff polling as wait_for_receive_request.
+        """
         start_time = time.time()
         timeout = timeout * (10 * trace)
+        delay = 0.001
         self.read_status_byte()
         while self.status_byte.transmit_accept != self.control_byte.transmit_request:
+            time.sleep(delay)
+            delay = min(delay * 2, 0.008)
             self.read_status_byte()
             if time.time() - start_time > timeout:
                 raise TimeoutError("Timeout waiting for transmit accept")
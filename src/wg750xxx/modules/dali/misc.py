@@ -11,6 +11,37 @@ def iterate_bits(byte: int) -> Generator[tuple[bool, int]]:
         yield bool((byte >> i) & 1), i
 
 
+# Set-bit indices for every byte value, built once at import so decoding a
+# response byte is a single table lookup instead of eight shift-and-test
+# iterations
+_SET_BITS: list[tuple[int, ...]] = [
+    tuple(i for i in range(8) if (byte >> i) & 1) for byte in range(256)
+]
+
+
+def set_bit_indices(byte: int) -> tuple[int, ...]:
+    """Get the indices of the set bits in a byte."""
+    return _SET_BITS[byte]
+
+
+def set_bits_in_u32(x: int, offset: int = 0) -> list[int]:
+    """Get the indices of the set bits in a 32 bit value.
+
+    Extracts the lowest set bit with ``x & -x`` until the value is
+    exhausted, so the loop runs once per set bit instead of once per bit
+    position.
+    """
+    out: list[int] = []
+    # Bind the append once; saves an attribute lookup per set bit
+    out_append = out.append
+    offset -= 1
+    while x:
+        lsb = x & -x
+        out_append(offset + lsb.bit_length())
+        x ^= lsb
+    return out
+
+
 def get_bit(byte: int, bit_index: int) -> bool:
     """Get the value of a bit in a byte."""
     return bool((byte >> bit_index) & 1)
@@ -26,19 +57,14 @@ def dali_response_to_channel_list(
     response: DaliInputMessage | None, offset: int = 0
 ) -> list[int]:
     """Convert DALI response to channel list."""
-    channels: list[int] = []
     if response is None:
-        return channels
-    channels.extend(
-        [offset + i for bit, i in iterate_bits(response.dali_response) if bit]
-    )
-    channels.extend(
-        [offset + 8 + i for bit, i in iterate_bits(response.message_3) if bit]
-    )
-    channels.extend(
-        [offset + 16 + i for bit, i in iterate_bits(response.message_2) if bit]
-    )
-    channels.extend(
-        [offset + 24 + i for bit, i in iterate_bits(response.message_1) if bit]
+        return []
+    response_byte, message_3, message_2, message_1 = response.as_bytes()
+    # int() guards against numpy scalars, which lack bit_length
+    packed = (
+        int(response_byte)
+        | int(message_3) << 8
+        | int(message_2) << 16
+        | int(message_1) << 24
     )
-    return channels
+    return set_bits_in_u32(packed, offset)
@@ -3,7 +3,8 @@
 # pylint: disable=unused-variable,too-many-public-methods
 import logging
 
-from .dali_communication import DaliCommunicationRegister
+from .dali_communication import DaliCommunicationRegister, DaliOutputMessage
+from .misc import dali_response_to_channel_list
 
 log = logging.getLogger(__name__)
 
@@ -23,3 +24,41 @@ class ModuleBase:
             dali_communication_register
         )
         self.dali_communication_register.read()
+
+    def _query_channel_pair(
+        self, low_extension: int, high_extension: int, high_offset: int = 0
+    ) -> list[int]:
+        """Run a [0-31]/[32-63] extension query pair as one batched transfer.
+
+        Both queries share the status/control register pre-read via
+        read_many instead of paying it once per write.
+        """
+        low_response, high_response = self.dali_communication_register.read_many(
+            [
+                DaliOutputMessage(command_extension=low_extension),
+                DaliOutputMessage(command_extension=high_extension),
+            ]
+        )
+        channels = dali_response_to_channel_list(low_response)
+        channels.extend(
+            dali_response_to_channel_list(high_response, offset=high_offset)
+        )
+        return channels
+
+    # 8. Abfrage Status Vorschaltgerät [0-31]
+    # 9. Abfrage Status Vorschaltgerät [32-63]
+    def query_status_psu(self) -> list[int]:
+        """Query status vorschaltgerät."""
+        return self._query_channel_pair(0x08, 0x09)
+
+    # 10. Abfrage Lampenausfall [0-31]
+    # 11. Abfrage Lampenausfall [32-63]
+    def query_lamp_failure(self) -> list[int]:
+        """Query lamp failure."""
+        return self._query_channel_pair(0x0A, 0x0B)
+
+    # 12. Abfrage Lampenleistung Ein [0-31]
+    # 13. Abfrage Lampenleistung Ein [32-63]
+    def query_lamp_power_on(self) -> list[int]:
+        """Query lamp power on."""
+        return self._query_channel_pair(0x0C, 0x0D)
@@ -4,7 +4,6 @@
 import logging
 
 from .dali_communication import DaliInputMessage, DaliOutputMessage
-from .misc import dali_response_to_channel_list
 from .module_base import ModuleBase
 
 log = logging.getLogger(__name__)
@@ -19,86 +18,10 @@ class ModuleSetup(ModuleBase):
     # 7. Query short address present [32-63]
     def query_short_address_present(self) -> list[int]:
         """Query short address present."""
-        channels = []
-        channels.extend(
-            dali_response_to_channel_list(
-                self.dali_communication_register.write(
-                    DaliOutputMessage(command_extension=0x06), response=True
-                ),
-                offset=0,
-            )
-        )
-        channels.extend(
-            dali_response_to_channel_list(
-                self.dali_communication_register.write(
-                    DaliOutputMessage(command_extension=0x07), response=True
-                ),
-                offset=32,
-            )
-        )
-        return channels
-
-    # 8. Abfrage Status Vorschaltgerät [0-31]
-    # 9. Abfrage Status Vorschaltgerät [32-63]
-    def query_status_psu(self) -> list[int]:
-        """Query status vorschaltgerät."""
-        channels = []
-        channels.extend(
-            dali_response_to_channel_list(
-                self.dali_communication_register.write(
-                    DaliOutputMessage(command_extension=0x08), response=True
-                )
-            )
-        )
-        channels.extend(
-            dali_response_to_channel_list(
-                self.dali_communication_register.write(
-                    DaliOutputMessage(command_extension=0x09), response=True
-                )
-            )
-        )
-        return channels
+        return self._query_channel_pair(0x06, 0x07, high_offset=32)
 
-    # 10. Abfrage Lampenausfall [0-31]
-    # 11. Abfrage Lampenausfall [32-63]
-    def query_lamp_failure(self) -> None:
-        """Query lamp failure."""
-        channels = []
-        channels.extend(
-            dali_response_to_channel_list(
-                self.dali_communication_register.write(
-                    DaliOutputMessage(command_extension=0x0A), response=True
-                )
-            )
-        )
-        channels.extend(
-            dali_response_to_channel_list(
-                self.dali_communication_register.write(
-                    DaliOutputMessage(command_extension=0x0B), response=True
-                )
-            )
-        )
-
-    # 12. Abfrage Lampenleistung Ein [0-31]
-    # 13. Abfrage Lampenleistung Ein [32-63]
-    def query_lamp_power_on(self) -> list[int]:
-        """Query lamp power on."""
-        channels = []
-        channels.extend(
-            dali_response_to_channel_list(
-                self.dali_communication_register.write(
-                    DaliOutputMessage(command_extension=0x0C), response=True
-                )
-            )
-        )
-        channels.extend(
-            dali_response_to_channel_list(
-                self.dali_communication_register.write(
-                    DaliOutputMessage(command_extension=0x0D), response=True
-                )
-            )
-        )
-        return channels
+    # 8-13. Query status vorschaltgerät / lamp failure / lamp power on
+    # inherited from ModuleBase
 
     # 14. Einstellung DALI/DSI-Modus und Polling
     def set_dali_dsi_mode_and_polling(self) -> None:
@@ -13,67 +13,33 @@ log = logging.getLogger(__name__)
 class ModuleStatus(ModuleBase):
     """DALI status."""
 
-    # 8. Abfrage Status Vorschaltgerät [0-31]
-    # 9. Abfrage Status Vorschaltgerät [32-63]
-    def query_status_psu(self) -> list[int]:
-        """Query status vorschaltgerät."""
-        channels = []
-        channels.extend(
-            dali_response_to_channel_list(
-                self.dali_communication_register.write(
-                    DaliOutputMessage(command_extension=0x08), response=True
-                )
-            )
-        )
-        channels.extend(
-            dali_response_to_channel_list(
-                self.dali_communication_register.write(
-                    DaliOutputMessage(command_extension=0x09), response=True
-                )
-            )
-        )
-        return channels
+    # 8-13. Query status vorschaltgerät / lamp failure / lamp power on
+    # inherited from ModuleBase
 
-    # 10. Abfrage Lampenausfall [0-31]
-    # 11. Abfrage Lampenausfall [32-63]
-    def query_lamp_failure(self) -> None:
-        """Query lamp failure."""
-        channels = []
-        channels.extend(
-            dali_response_to_channel_list(
-                self.dali_communication_register.write(
-                    DaliOutputMessage(command_extension=0x0A), response=True
-                )
-            )
-        )
-        channels.extend(
-            dali_response_to_channel_list(
-                self.dali_communication_register.write(
-                    DaliOutputMessage(command_extension=0x0B), response=True
-                )
-            )
-        )
+    # 8-13. All three health views in one sweep
+    def query_all_health(self) -> dict[str, list[int]]:
+        """Query PSU status, lamp failure and lamp power on together.
 
-    # 12. Abfrage Lampenleistung Ein [0-31]
-    # 13. Abfrage Lampenleistung Ein [32-63]
-    def query_lamp_power_on(self) -> list[int]:
-        """Query lamp power on."""
-        channels = []
-        channels.extend(
-            dali_response_to_channel_list(
-                self.dali_communication_register.write(
-                    DaliOutputMessage(command_extension=0x0C), response=True
-                )
-            )
-        )
-        channels.extend(
-            dali_response_to_channel_list(
-                self.dali_communication_register.write(
-                    DaliOutputMessage(command_extension=0x0D), response=True
-                )
+        Issues all six extension queries through one batched transfer so
+        callers that want the full health picture pay the shared register
+        pre-reads once instead of once per query pair.
+        """
+        psu_low, psu_high, fail_low, fail_high, power_low, power_high = (
+            self.dali_communication_register.read_many(
+                [
+                    DaliOutputMessage(command_extension=command_extension)
+                    for command_extension in (0x08, 0x09, 0x0A, 0x0B, 0x0C, 0x0D)
+                ]
             )
         )
-        return channels
+        return {
+            "psu": dali_response_to_channel_list(psu_low)
+            + dali_response_to_channel_list(psu_high),
+            "lamp_failure": dali_response_to_channel_list(fail_low)
+            + dali_response_to_channel_list(fail_high),
+            "lamp_power_on": dali_response_to_channel_list(power_low)
+            + dali_response_to_channel_list(power_high),
+        }
 
     # 19. Rückantworten auf QUERY ACTUAL LEVEL Geräte 56 bis 59
     def query_actual_level_device_56_to_59(self) -> None:
@@ -1,6 +1,7 @@
 """Dali module."""
 
 from collections.abc import Callable
+from contextlib import AbstractContextManager
 from logging import getLogger
 from typing import Any, ClassVar, cast
 
@@ -49,11 +50,13 @@ class Wg750DaliMaster(WagoModule):
         self._initialized = True
         if self.auto_create_channels:
             self.create_channels()
-            self.groups: list[DaliChannel] = [
-                DaliChannel(address, self.dali_communication_register)
-                for address in range(0x40, 0x50)
-            ]
-            self.all: DaliChannel = DaliChannel(0x3F, self.dali_communication_register)
+        # Group (0x40-0x4F) and broadcast (0x3F) channels address many
+        # fixtures with a single DALI frame; constructing them touches no bus
+        self.groups: list[DaliChannel] = [
+            DaliChannel(address, self.dali_communication_register)
+            for address in range(0x40, 0x50)
+        ]
+        self.all: DaliChannel = DaliChannel(0x3F, self.dali_communication_register)
 
         self.setup: ModuleSetup = ModuleSetup(self.dali_communication_register)
         self.status: ModuleStatus = ModuleStatus(self.dali_communication_register)
@@ -71,6 +74,30 @@ class Wg750DaliMaster(WagoModule):
             return 0
         return len(self.channels)
 
+    def transaction(self) -> AbstractContextManager[None]:
+        """Batch the DALI commands issued inside a with-block.
+
+        Delegates to the communication register: queued writes go out as
+        one batch on the first response read or at block exit.
+        """
+        return self.dali_communication_register.transaction()
+
+    def set_group_brightness(self, group_index: int, value: int) -> None:
+        """Set the brightness of every fixture in a DALI group.
+
+        One group-addressed frame applies to all group members at once;
+        prefer this over looping the individual channels.
+        """
+        self.groups[group_index].brightness = value
+
+    def set_all_brightness(self, value: int) -> None:
+        """Set the brightness of every fixture on the bus via broadcast.
+
+        One broadcast frame replaces one frame per channel; prefer this
+        over iterating the channel list.
+        """
+        self.all.brightness = value
+
     def create_channels(self) -> None:
         """Create the channels of the DALI master."""
         if not self._initialized:
@@ -83,6 +110,9 @@ class Wg750DaliMaster(WagoModule):
                 "Error setting up DALI channels: Timeout waiting for Dali Response"
             )
             return
+        # Bring-up is one batched query pair (query_short_address_present)
+        # plus pure object construction per address — DaliChannel.__init__
+        # touches no bus, so there is no per-channel round-trip to overlap
         for dali_address in short_addresses:
             self.append_channel(
                 DaliChannel(
@@ -103,16 +133,15 @@ class Wg750DaliMaster(WagoModule):
         """Set the callback function that gets called when the channel value changes."""
         self._on_change_callback = callback
 
-        # If we have a modbus channel and a valid callback, register with ModbusConnection
-        if len(self.modbus_channels["input"]) > 0 and callback is not None:
-            if hasattr(self.modbus_connection, "register_channel_callback"):
-                for channel in self.modbus_channels["input"]:
-                    self.modbus_connection.register_channel_callback(channel, self)
-        elif len(self.modbus_channels["input"]) > 0 and callback is None:
+        # ModbusConnection always implements the registration interface, so
+        # register directly instead of hasattr-probing per channel
+        if callback is not None:
+            for channel in self.modbus_channels["input"]:
+                self.modbus_connection.register_channel_callback(channel, self)
+        else:
             # Unregister if callback is set to None
-            if hasattr(self.modbus_connection, "unregister_channel_callback"):
-                for channel in self.modbus_channels["input"]:
-                    self.modbus_connection.unregister_channel_callback(channel, self)
+            for channel in self.modbus_channels["input"]:
+                self.modbus_connection.unregister_channel_callback(channel, self)
 
     def notify_value_change(self, new_value: Any) -> None:
         """Notify the channel that its value has changed."""
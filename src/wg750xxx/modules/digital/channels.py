@@ -1,24 +1,60 @@
 """Basic channels for the Wago 750 series."""
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from enum import Enum
 import time
-from typing import Any, Self
+from typing import Any, ClassVar, Self
 
-from wg750xxx.modbus.state import Coil, Discrete
-from wg750xxx.modules.channel import WagoChannel
+import numpy as np
+
+from wg750xxx.modbus.state import Coil, Discrete, ModbusChannelType, ModbusConnection
+from wg750xxx.modules.channel import ChannelMetadata, WagoChannel
 from wg750xxx.modules.exceptions import WagoModuleError
 
 
-class DigitalIn(WagoChannel):
+def read_all_digital(channels: Sequence[WagoChannel]) -> list[bool]:
+    """Read many digital channels with one vectorized gather per table.
+
+    The discrete and coil state tables are numpy bool arrays, so instead
+    of one Python call per channel the addresses are collected and fancy
+    indexed in a single numpy operation per (connection, table) pair.
+    Results come back in channel order.
+    """
+    results: list[bool] = [False] * len(channels)
+    groups: dict[
+        tuple[int, ModbusChannelType],
+        tuple[ModbusConnection, list[int], list[int]],
+    ] = {}
+    for position, channel in enumerate(channels):
+        modbus_channel = channel.modbus_channel
+        if modbus_channel is None:
+            raise WagoModuleError(f"Modbus channel not set for {channel.name}")
+        connection = modbus_channel.modbus_connection
+        key = (id(connection), modbus_channel.channel_type)
+        if key not in groups:
+            groups[key] = (connection, [], [])
+        _, positions, addresses = groups[key]
+        positions.append(position)
+        addresses.append(modbus_channel.address)
+    for (_, channel_type), (connection, positions, addresses) in groups.items():
+        values = connection.state[channel_type].value[np.asarray(addresses)]
+        for position, value in zip(positions, values, strict=True):
+            results[position] = bool(value)
+    return results
+
+
+class DigitalIn(WagoChannel, channel_label="Digital In"):
     """Digital Input."""
 
-    platform: str = "binary_sensor"
-    device_class: str = "binary_sensor"
-    unit_of_measurement: str = ""
-    icon: str = "mdi:binary"
-    value_template: str = "{{ value | bool }}"
+    metadata: ClassVar[ChannelMetadata] = ChannelMetadata(
+        "binary_sensor", "binary_sensor", "", "mdi:binary", "{{ value | bool }}"
+    )
+    # Expected modbus channel class, fixed per class so the constructor
+    # guard is a single comparison stripped under python -O. Discrete and
+    # Coil are leaf classes, so an exact type identity check is correct
+    # and skips the isinstance MRO walk.
+    _required_modbus_type: type = Discrete
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the digital input channel.
@@ -27,13 +63,11 @@ class DigitalIn(WagoChannel):
             *args: The arguments to pass to the superclass.
             **kwargs: The keyword arguments to pass to the superclass.
 
-        Raises:
-            ValueError: If the modbus_channel is not a Discrete.
-
         """
-        super().__init__("Digital In", *args, **kwargs)
-        if not isinstance(self.modbus_channel, Discrete):
-            raise TypeError("modbus_channel must be a Discrete")
+        super().__init__(*args, **kwargs)
+        assert type(self.modbus_channel) is self._required_modbus_type, (
+            f"modbus_channel must be a {self._required_modbus_type.__name__}"
+        )
 
     def get_instance(self) -> "Self | EventButton":
         """Get an instance of the channel."""
@@ -60,14 +94,14 @@ class DigitalIn(WagoChannel):
         raise WagoModuleError("Can not write to input channel")
 
 
-class DigitalOut(WagoChannel):
+class DigitalOut(WagoChannel, channel_label="Digital Out"):
     """Digital Output."""
 
-    platform: str = "switch"
-    device_class: str = "switch"
-    unit_of_measurement: str = ""
-    icon: str = "mdi:binary"
-    value_template: str = "{{ value | bool }}"
+    metadata: ClassVar[ChannelMetadata] = ChannelMetadata(
+        "switch", "switch", "", "mdi:binary", "{{ value | bool }}"
+    )
+    # See DigitalIn._required_modbus_type
+    _required_modbus_type: type = Coil
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the digital output channel.
@@ -76,13 +110,11 @@ class DigitalOut(WagoChannel):
             *args: The arguments to pass to the superclass.
             **kwargs: The keyword arguments to pass to the superclass.
 
-        Raises:
-            ValueError: If the modbus_channel is not a Coil.
-
         """
-        super().__init__("Digital Out", *args, **kwargs)
-        if not isinstance(self.modbus_channel, Coil):
-            raise TypeError("modbus_channel must be a Coil")
+        super().__init__(*args, **kwargs)
+        assert type(self.modbus_channel) is self._required_modbus_type, (
+            f"modbus_channel must be a {self._required_modbus_type.__name__}"
+        )
 
     def write(self, value: Any) -> None:
         """Write a value to the digital output channel."""
@@ -117,11 +149,9 @@ class EventButton(DigitalIn):
     All buttons are monitored by a single shared async task for efficiency.
     """
 
-    platform: str = "binary_sensor"
-    device_class: str = "event_button"
-    unit_of_measurement: str = ""
-    icon: str = "mdi:gesture-tap-button"
-    value_template: str = "{{ value }}"
+    metadata: ClassVar[ChannelMetadata] = ChannelMetadata(
+        "binary_sensor", "event_button", "", "mdi:gesture-tap-button", "{{ value }}"
+    )
 
     # Configuration constants
     DEBOUNCE_TIMEOUT = 0.05  # seconds to ignore rapid changes
@@ -128,7 +128,7 @@ class WagoModule:
         self._channel_init_config: list[ChannelConfig] | None = None
         self._config: ModuleConfig | None = None
         self.update_interval: int = update_interval or DEFAULT_SCAN_INTERVAL
-        log.debug("Initializing module %s", self.__repr__())
+        log.debug("Initializing module %s", self)
 
         if module_identifier is not None:
             self.module_identifier = module_identifier
@@ -161,7 +161,7 @@ class WagoModule:
                     "Class not fully initialized yet, create_channels method not callable yet for %s.",
                     self.__class__.__name__,
                 )
-        log.debug("Finished initializing module %s", self.__repr__())
+        log.debug("Finished initializing module %s", self)
 
     @property
     def module_identifier(self) -> ModuleIdentifier:
@@ -231,7 +231,8 @@ class WagoModule:
     def config(self) -> ModuleConfig:
         """Get the configuration of the module."""
         if not hasattr(self, "_config") or self._config is None:
-            self._config = ModuleConfig(
+            # Values come from the module registry, so skip validation
+            self._config = ModuleConfig.fast(
                 index=self.index,
                 type=self.spec.module_type,
                 name=self.display_name or self.spec.module_type,
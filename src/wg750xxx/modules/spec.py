@@ -5,6 +5,11 @@ from typing import NamedTuple
 
 from wg750xxx.modbus.state import ModbusChannelSpec
 
+# Bit positions of IOType.flags
+IO_DIGITAL = 0b001
+IO_INPUT = 0b010
+IO_OUTPUT = 0b100
+
 
 class IOType(NamedTuple):
     """IO type specification."""
@@ -13,6 +18,15 @@ class IOType(NamedTuple):
     input: bool = False
     output: bool = False
 
+    @property
+    def flags(self) -> int:
+        """Pack the category booleans into one bit field.
+
+        Lets filters test a category with a single mask comparison, e.g.
+        ``io.flags & (IO_DIGITAL | IO_INPUT) == IO_DIGITAL | IO_INPUT``.
+        """
+        return self.digital | self.input << 1 | self.output << 2
+
     def __str__(self) -> str:
         """Get the string representation of the IO type."""
         d = "Digital" if self.digital else ""
@@ -31,6 +45,31 @@ class IOType(NamedTuple):
         )
 
 
+# Flyweight construction: only eight IOType combinations exist, so
+# IOType(...) hands out one canonical instance per combination and
+# filters may compare io_type values by identity. NamedTuple forbids
+# overriding __new__ in the class body, hence the post-class swap.
+_IO_TYPE_CACHE: dict[tuple[bool, bool, bool], IOType] = {}
+_io_type_new = IOType.__new__
+
+
+def _cached_io_type(
+    cls: type[IOType],
+    digital: bool = False,
+    input: bool = False,  # pylint: disable=redefined-builtin
+    output: bool = False,
+) -> IOType:
+    key = (bool(digital), bool(input), bool(output))
+    cached = _IO_TYPE_CACHE.get(key)
+    if cached is None:
+        cached = _io_type_new(cls, *key)
+        _IO_TYPE_CACHE[key] = cached
+    return cached
+
+
+IOType.__new__ = _cached_io_type  # type: ignore[method-assign]
+
+
 @dataclass
 class ModuleSpec:
     """Module specification."""
@@ -1,10 +1,24 @@
 """Settings for the Wago 750."""
 
-from pydantic import BaseModel, Field
+from functools import cache
+from typing import Any, Self
+
+from pydantic import BaseModel, Field, PrivateAttr
 
 from .const import DEFAULT_SCAN_INTERVAL
 
 
+@cache
+def _type_slug(type_: str) -> str:
+    """Lowercase a type label and replace spaces, memoized per label.
+
+    Only a handful of distinct channel and module type labels exist, so
+    the id properties below pay the replace/lower cost once per label
+    instead of once per id build.
+    """
+    return str(type_).replace(" ", "_").lower()
+
+
 class ChannelConfig(BaseModel):
     """Channel Settings."""
 
@@ -32,13 +46,31 @@ class ChannelConfig(BaseModel):
         default=DEFAULT_SCAN_INTERVAL,
     )
 
+    # Cached id keyed by its inputs, so repeated lookups skip the string
+    # work but a field assignment still yields a fresh value
+    _id_cache: tuple[tuple[str | None, int | None, str], str] | None = PrivateAttr(
+        default=None
+    )
+
+    @classmethod
+    def fast(cls, **kwargs: Any) -> Self:
+        """Construct without validation from trusted internal values.
+
+        For configs the library builds from its own module registry;
+        user-supplied settings must go through normal validation.
+        """
+        return cls.model_construct(**kwargs)
+
     @property
     def id(self) -> str:
         """Generate a unique id for the channel."""
-
-        return (
-            f"{self.module_id}_{self.index}_{str(self.type).replace(' ', '_').lower()}"
-        )
+        key = (self.module_id, self.index, self.type)
+        cached = self._id_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        value = f"{self.module_id}_{self.index}_{_type_slug(self.type)}"
+        self._id_cache = (key, value)
+        return value
 
 
 class ModuleConfig(BaseModel):
@@ -57,11 +89,27 @@ class ModuleConfig(BaseModel):
         description="The channels of the module", default=None
     )
 
+    # See ChannelConfig._id_cache
+    _id_cache: tuple[tuple[int | None, str], str] | None = PrivateAttr(default=None)
+
+    @classmethod
+    def fast(cls, **kwargs: Any) -> Self:
+        """Construct without validation from trusted internal values.
+
+        See ChannelConfig.fast.
+        """
+        return cls.model_construct(**kwargs)
+
     @property
     def id(self) -> str:
         """Generate a unique id for the module."""
-
-        return f"{self.index}_{str(self.type).replace(' ', '_').lower()}"
+        key = (self.index, self.type)
+        cached = self._id_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        value = f"{self.index}_{_type_slug(self.type)}"
+        self._id_cache = (key, value)
+        return value
 
 
 class HubConfig(BaseModel):
@@ -78,6 +126,14 @@ class HubConfig(BaseModel):
         description="The global update interval of the hub in milliseconds",
         default=DEFAULT_SCAN_INTERVAL,
     )
+    tcp_nodelay: bool = Field(
+        description="Disable Nagle's algorithm on the Modbus TCP socket",
+        default=True,
+    )
+    keepalive: bool = Field(
+        description="Enable TCP keepalive on the Modbus TCP socket",
+        default=True,
+    )
 
 
 class ModbusSettings(BaseModel):
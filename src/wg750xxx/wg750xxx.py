@@ -3,15 +3,31 @@
 Represents a Wago 750 controller and its connected modules.
 """
 
+from collections import defaultdict
 from collections.abc import Iterator
 import logging
-from typing import overload
+import socket
+import time
+from typing import Literal, overload
 
+import numpy as np
 from pydantic import BaseModel
 from pymodbus.client import ModbusTcpClient
 
-from .modbus.registers import Register, test_constants
-from .modbus.state import AddressDict, ModbusChannelSpec, ModbusConnection
+from .modbus.registers import (
+    Register,
+    test_constants,
+    test_constants_values,
+    words_to_string,
+)
+from .modbus.state import (
+    CHANNEL_TYPES,
+    AddressDict,
+    ModbusChannel,
+    ModbusChannelSpec,
+    ModbusChannelType,
+    ModbusConnection,
+)
 from .modules.identifier import ModuleIdentifier
 from .modules.module import WagoModule
 from .modules.spec import IOType
@@ -37,29 +53,85 @@ class Modules:
     def __init__(self) -> None:
         """Initialize the modules."""
         self._modules: list[WagoModule] = []
+        # Lookup indices kept in sync by append_module/reset_modules so that
+        # get() does not have to scan the module list on every call
+        self._by_io_type: defaultdict[IOType, list[WagoModule]] = defaultdict(list)
+        self._by_type: defaultdict[str, list[WagoModule]] = defaultdict(list)
+        self._by_alias: defaultdict[str, list[WagoModule]] = defaultdict(list)
+        self._digital: list[WagoModule] = []
+        self._analog: list[WagoModule] = []
+        # Lazily built per-type channel registry; lives here so every
+        # mutation path (including the discovery code appending directly)
+        # invalidates it
+        self._channels_by_type: (
+            dict[ModbusChannelType, tuple[ModbusChannel, ...]] | None
+        ) = None
 
     def append_module(self, module: WagoModule) -> None:
         """Append a module to the modules."""
+        self._channels_by_type = None
         self._modules.append(module)
+        self._by_io_type[module.spec.io_type].append(module)
+        self._by_type[module.spec.module_type].append(module)
+        for alias in module.aliases:
+            self._by_alias[alias].append(module)
+            if alias != module.spec.module_type:
+                self._by_type[alias].append(module)
+        if module.spec.io_type.digital:
+            self._digital.append(module)
+        else:
+            self._analog.append(module)
 
     def reset_modules(self) -> None:
         """Reset the modules."""
+        self._channels_by_type = None
         self._modules = []
+        self._by_io_type.clear()
+        self._by_type.clear()
+        self._by_alias.clear()
+        self._digital.clear()
+        self._analog.clear()
+
+    @property
+    def channels_by_type(self) -> dict[ModbusChannelType, tuple[ModbusChannel, ...]]:
+        """Get all modbus channels flattened per register type, in bus order.
+
+        Built lazily and invalidated by append_module/reset_modules, so
+        bulk consumers iterate one flat tuple instead of pointer-chasing
+        through every module.
+        """
+        if self._channels_by_type is None:
+            channels: dict[ModbusChannelType, list[ModbusChannel]] = {
+                channel_type: [] for channel_type in CHANNEL_TYPES
+            }
+            for module in self._modules:
+                for channel_type, module_channels in module.modbus_channels.items():
+                    channels[channel_type].extend(module_channels)
+            self._channels_by_type = {
+                channel_type: tuple(flat) for channel_type, flat in channels.items()
+            }
+        return self._channels_by_type
 
     def all(self) -> list[WagoModule]:
         """Get the modules."""
         return self._modules
 
+    @property
+    def digital(self) -> list[WagoModule]:
+        """Get the digital modules, in bus order."""
+        return self._digital
+
+    @property
+    def analog(self) -> list[WagoModule]:
+        """Get the analog modules, in bus order."""
+        return self._analog
+
     def get(self, select: IOType | str | None = None) -> list[WagoModule] | WagoModule:
         """Get the modules."""
         if isinstance(select, IOType):
-            modules = [i for i in self._modules if i.spec.io_type == select]
+            modules = list(self._by_io_type.get(select, ()))
         elif isinstance(select, str):
-            modules = [
-                i
-                for i in self._modules
-                if i.spec.module_type == select or select in i.aliases
-            ]
+            modules = list(self._by_type.get(select, ()))
         else:
             modules = self._modules
         if len(modules) == 1:
@@ -86,13 +158,13 @@ class Modules:
         if isinstance(index, int):
             return self._modules[index]
         if isinstance(index, str):
-            # If index is a string, try to find the module by alias
-            modules = [
-                m for m in self._modules if index in [*m.aliases, m.module_identifier]
-            ]
+            # If index is a string, try to find the module by alias; the
+            # index is kept in bus order by append_module, so this matches
+            # a scan of self._modules without walking it
+            modules = self._by_alias.get(index)
             if not modules:
                 raise KeyError(f"No module found with alias {index}")
-            return modules[0] if len(modules) == 1 else modules
+            return modules[0] if len(modules) == 1 else list(modules)
         raise TypeError("Index must be integer, slice, or string")
 
     def __iter__(self) -> Iterator[WagoModule]:
@@ -136,6 +208,11 @@ class PLCHub:
             input=0, holding=0, discrete=0, coil=0
         )
         self._client: ModbusTcpClient | None = None
+        self._connected_cache: tuple[float, bool] = (0.0, False)
+        # Controller identity and process-state width only change with a
+        # controller reboot, so they are cached across reconnects
+        self._cached_info: ControllerInfo | None = None
+        self._cached_width: ModbusChannelSpec | None = None
         self.connection: ModbusConnection | None = None
         self.is_initialized: bool = False
         self.is_module_discovery_done: bool = False
@@ -149,18 +226,54 @@ class PLCHub:
             self._modbus_host, port=self._modbus_port, timeout=5
         )
         self._client.connect()
-        self._process_state_width = self._read_data_width_in_state()
+        self._connected_cache = (0.0, False)
+        self._set_socket_options()
+        if self._cached_width is None:
+            self._cached_width = self._read_data_width_in_state()
+        self._process_state_width = self._cached_width
         self.connection = ModbusConnection(
             modbus_tcp_client=self._client,
             bits_in_state=self._process_state_width,
             update_interval=self.config.update_interval,
+            tcp_nodelay=self.config.tcp_nodelay,
+            keepalive=self.config.keepalive,
         )
         self.connection.update_state()
 
+    def _set_socket_options(self) -> None:
+        """Disable Nagle's algorithm and enable keepalive on the client socket.
+
+        The many small Modbus PDUs otherwise interact badly with the
+        Nagle/delayed-ACK combination and can stall every request/response
+        round-trip. Must be reapplied whenever the socket is reopened.
+        Both options can be turned off via HubConfig.
+        """
+        if self._client is None:
+            return
+        try:
+            sock = self._client.socket
+            if sock is not None:
+                if self.config.tcp_nodelay:
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                if self.config.keepalive:
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except (AttributeError, OSError):
+            # Socket attribute naming differs between pymodbus versions
+            log.debug("Could not set socket options on the Modbus TCP client")
+
     @property
     def is_connected(self) -> bool:
-        """Check if the hub is connected."""
-        return self._client is not None and self._client.connected
+        """Check if the hub is connected.
+
+        The pymodbus connection check is cached for a second since this is
+        queried on every polling tick.
+        """
+        checked_at, connected = self._connected_cache
+        now = time.monotonic()
+        if now - checked_at > 1.0:
+            connected = self._client is not None and self._client.connected
+            self._connected_cache = (now, connected)
+        return connected
 
     def initialize(self, discovery: bool = True) -> None:
         """Initialize the hub."""
@@ -172,7 +285,9 @@ class PLCHub:
         if self.connection is not None:
             self.connection.update_state()
 
-        self.info: ControllerInfo = self._read_controller_info()
+        if self._cached_info is None:
+            self._cached_info = self._read_controller_info()
+        self.info: ControllerInfo = self._cached_info
         if discovery:
             self.run_discovery()
         self.is_initialized = True
@@ -262,14 +377,27 @@ class PLCHub:
         if self._client is None:
             raise ValueError("Client not initialized")
         response = self._client.read_input_registers(address, count=width)
-        return Register(address, response.registers)
+        # asarray keeps the single C-level conversion from the pymodbus list
+        # and lets Words adopt the array without another copy
+        return Register(address, np.asarray(response.registers, dtype=np.uint16))
+
+    def _read_register_values(
+        self, address: int, width: int = 1
+    ) -> "np.ndarray[tuple[int, ...], np.dtype[np.uint16]]":
+        """Read a register range as a raw word array for internal parsing."""
+        if self._client is None:
+            raise ValueError("Client not initialized")
+        response = self._client.read_input_registers(address, count=width)
+        return np.asarray(response.registers, dtype=np.uint16)
 
     def _read_and_check_test_constants(self) -> None:
-        """Read and check the test constants."""
-        for item in test_constants:
-            register = self._read_register(item.address)
-            log.debug("register: %s", str(register))
-            assert item == register, f"Error: {item} != {register}"
+        """Read and check the test constants with a single block read."""
+        start = test_constants[0].address
+        block = self._read_register(start, width=len(test_constants))
+        log.debug("register: %s", str(block))
+        assert np.array_equal(block.value, test_constants_values), (
+            f"Error: {test_constants} != {block}"
+        )
 
     def _get_connected_modules_from_controller(self, reset: bool = True) -> list[int]:
         """Read the connected modules from the controller."""
@@ -278,9 +406,14 @@ class PLCHub:
         if reset:
             self.modules.reset_modules()
         register_values: list[int] = []
+        # Each description register (0x2030..0x2032) returns a buffer of 64
+        # module slots. A block with a free (zero) slot is the last one, so
+        # the remaining round-trips can be skipped.
         for i in range(3):
             response = self._client.read_input_registers(0x2030 + i, count=64).registers
-            register_values = register_values + response
+            register_values += response
+            if 0 in response:
+                break
         return register_values
 
     def _autocreate_modules(self) -> None:
@@ -288,28 +421,54 @@ class PLCHub:
         if self.connection is None:
             raise ValueError("Connection is not initialized")
         self.modules.reset_modules()
-        for value in self._discovery_register_values:
-            if value != 0:
-                index = len(self.modules)
-                module_settings = (
-                    self._init_config[index] if index < len(self._init_config) else None
-                )
-                module = WagoModule.module_factory(
-                    index=index,
-                    module_identifier=ModuleIdentifier(value),
-                    modbus_address=AddressDict(self._next_address),
-                    modbus_connection=self.connection,
-                    config=module_settings,
-                )
-                self.modules.append_module(module)
-                next_address = module.get_next_address()
-                if isinstance(next_address, dict):
-                    self._next_address.update(next_address)
+        # Skip the empty slots up front so the Python loop only visits the
+        # modules that are actually present
+        values = np.asarray(self._discovery_register_values, dtype=np.uint16)
+        for value in values[np.flatnonzero(values)].tolist():
+            index = len(self.modules)
+            module_settings = (
+                self._init_config[index] if index < len(self._init_config) else None
+            )
+            module = WagoModule.module_factory(
+                index=index,
+                module_identifier=ModuleIdentifier(value),
+                modbus_address=AddressDict(self._next_address),
+                modbus_connection=self.connection,
+                config=module_settings,
+            )
+            self.modules.append_module(module)
+            next_address = module.get_next_address()
+            if isinstance(next_address, dict):
+                self._next_address.update(next_address)
 
     def append_module(self, module: WagoModule) -> None:
         """Append a module to the hub."""
         self.modules.append_module(module)
 
+    @property
+    def channels_by_type(self) -> dict[ModbusChannelType, tuple[ModbusChannel, ...]]:
+        """Get all modbus channels flattened per register type, in bus order.
+
+        Maintained by Modules so every mutation path, including module
+        discovery, invalidates it.
+        """
+        return self.modules.channels_by_type
+
+    def get_digital_modules(self) -> list[WagoModule]:
+        """Get the digital modules, in bus order.
+
+        Served from the partition kept in sync by append_module, so the
+        module list is never rescanned.
+        """
+        return self.modules.digital
+
+    def get_analog_modules(self) -> list[WagoModule]:
+        """Get the analog modules, in bus order.
+
+        See get_digital_modules.
+        """
+        return self.modules.analog
+
     def reset_modules(self) -> None:
         """Reset the modules."""
         self._process_state_width = ModbusChannelSpec(
@@ -322,58 +481,63 @@ class PLCHub:
         """Read the data width in state."""
         # Read the width from the controller
         return ModbusChannelSpec(
-            holding=self._read_register(0x1022).value_to_int(),
-            input=self._read_register(0x1023).value_to_int(),
-            coil=self._read_register(0x1024).value_to_int(),
-            discrete=self._read_register(0x1025).value_to_int(),
+            holding=int(self._read_register_values(0x1022)[0]),
+            input=int(self._read_register_values(0x1023)[0]),
+            coil=int(self._read_register_values(0x1024)[0]),
+            discrete=int(self._read_register_values(0x1025)[0]),
         )
 
+    def sum_channels(
+        self,
+        channel_type: ModbusChannelType,
+        digital: bool,
+        direction: Literal["input", "output"],
+    ) -> int:
+        """Sum the spec'd channel counts of modules in one IO category.
+
+        One pass over the module list with a single io_type fetch per
+        module, shared by the discovery width checks and the tests.
+        """
+        total = 0
+        for module in self.modules:
+            io = module.spec.io_type
+            if io.digital == digital and (
+                io.input if direction == "input" else io.output
+            ):
+                total += module.spec.modbus_channels.get(channel_type, 0)
+        return total
+
     def _validate_module_discovery(self) -> None:
         """Validate the module discovery."""
         # If any of the widths is 0, try to calculate it from the modules
         # Calculate width from modules
-        self._process_state_width = self._read_data_width_in_state()
+        # Discovery implies the module layout may have changed, so this read
+        # deliberately refreshes the cached width
+        self._cached_width = self._read_data_width_in_state()
+        self._process_state_width = self._cached_width
         assert (
-            sum(
-                i.spec.modbus_channels.discrete
-                for i in self.modules
-                if i.spec.io_type.digital and i.spec.io_type.input
-            )
+            self.sum_channels("discrete", digital=True, direction="input")
             == self._process_state_width["discrete"]
         ), (
             f"Discovery failed: Discrete channels count does not match process state width {self._process_state_width['discrete']}"
         )
 
         assert (
-            sum(
-                i.spec.modbus_channels.coil
-                for i in self.modules
-                if i.spec.io_type.digital and i.spec.io_type.output
-            )
+            self.sum_channels("coil", digital=True, direction="output")
             == self._process_state_width["coil"]
         ), (
             f"Discovery failed: Coil channels count does not match process state width {self._process_state_width['coil']}"
         )
 
         assert (
-            sum(
-                i.spec.modbus_channels.input
-                for i in self.modules
-                if not i.spec.io_type.digital and i.spec.io_type.input
-            )
-            * 16
+            self.sum_channels("input", digital=False, direction="input") * 16
             == self._process_state_width["input"]
         ), (
             f"Discovery failed: Input channels count does not match process state width {self._process_state_width['input']}"
         )
 
         assert (
-            sum(
-                i.spec.modbus_channels.holding
-                for i in self.modules
-                if not i.spec.io_type.digital and i.spec.io_type.output
-            )
-            * 16
+            self.sum_channels("holding", digital=False, direction="output") * 16
             == self._process_state_width["holding"]
         ), (
             f"Discovery failed: Holding channels count does not match process state width {self._process_state_width['holding']}"
@@ -385,18 +549,18 @@ class PLCHub:
 
     def _read_controller_info(self) -> ControllerInfo:
         """Read the controller info."""
-        revision = self._read_register(0x2010).value_to_int()
-        series = self._read_register(0x2011).value_to_int()
-        item = self._read_register(0x2012).value_to_int()
-        fw_vers = (
-            f"{self._read_register(0x2013).value_to_int()}."
-            f"{self._read_register(0x2014).value_to_int()}"
-        )
+        # 0x2010..0x2014 are contiguous, read them in one request instead of
+        # five, and parse the raw word arrays without Register round-trips
+        info_block = self._read_register_values(0x2010, width=5)
+        revision = int(info_block[0])
+        series = int(info_block[1])
+        item = int(info_block[2])
+        fw_vers = f"{info_block[3]}.{info_block[4]}"
         fw_timestamp = (
-            f"{self._read_register(0x2022, 8).value_to_string()} "
-            f"{self._read_register(0x2021, 8).value_to_string()}"
+            f"{words_to_string(self._read_register_values(0x2022, 8))} "
+            f"{words_to_string(self._read_register_values(0x2021, 8))}"
         )
-        fw_info = self._read_register(0x2023, 32).value_to_string()
+        fw_info = words_to_string(self._read_register_values(0x2023, 32))
 
         return ControllerInfo(
             REVISION=revision,
@@ -411,6 +575,9 @@ class PLCHub:
         """Close the connection to the controller."""
         if self._client and self._client.connected:
             self._client.close()
+        self._connected_cache = (0.0, False)
+        self._cached_info = None
+        self._cached_width = None
 
     def __str__(self) -> str:
         """Return a string representation of the hub."""
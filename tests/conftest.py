@@ -19,7 +19,7 @@ from .mock.mock_modbus_tcp_client_for_dali_module import (
 logger = logging.getLogger(__name__)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def modules() -> dict[int, int]:
     """Define the default modules configuration.
 
@@ -76,6 +76,13 @@ def modbus_mock_with_modules(
 def dali_modbus_mock() -> Generator[MockModbusTcpClientForDaliModule, None, None]:
     """Create a mock for the ModbusTcpClient specifically for DALI modules.
 
+    The DALI mock starts from deterministic all-zero registers, so one
+    instance serves the whole test module; tests restore a clean slate
+    with ``reset()`` instead of reconstructing mock and hub. The patch
+    must not outlive the module: a session-wide patch would let the
+    physical-PLC integration tests construct a hub against this mock
+    instead of skipping.
+
     Returns:
         A specialized mock for DALI module testing
 
@@ -126,14 +133,16 @@ def configured_hub(
     # Now run the full initialization
     hub_instance.initialize(discovery=True)
 
-    logger.info(
-        json.dumps(
-            [i.config_dump() for i in hub_instance.modules],
-            sort_keys=True,
-            indent=4,
-            default=str,
+    if logger.isEnabledFor(logging.INFO):
+        # The indented, sorted dump is expensive; skip it when INFO is off
+        logger.info(
+            json.dumps(
+                [i.config_dump() for i in hub_instance.modules],
+                sort_keys=True,
+                indent=4,
+                default=str,
+            )
         )
-    )
     return hub_instance
 
 
@@ -158,14 +167,16 @@ def dali_hub(
     # Now run the full initialization
     hub_instance.initialize(discovery=True)
 
-    logger.info(
-        json.dumps(
-            [i.config_dump() for i in hub_instance.modules],
-            sort_keys=True,
-            indent=4,
-            default=str,
+    if logger.isEnabledFor(logging.INFO):
+        # The indented, sorted dump is expensive; skip it when INFO is off
+        logger.info(
+            json.dumps(
+                [i.config_dump() for i in hub_instance.modules],
+                sort_keys=True,
+                indent=4,
+                default=str,
+            )
         )
-    )
     assert hub_instance is not None, "Hub instance should be present"
     assert hub_instance.connection is not None, "Hub connection should be present"
     return hub_instance
@@ -190,9 +190,9 @@ class MockModbusTcpClient:
             log.info("Reading (next) 64 Module IDs")
             response.registers = [0] * 64
         elif address == 0x2010:
-            # REVISION
-            log.info("Reading REVISION")
-            response.registers = [1]
+            # Controller info block: REVISION, SERIES, ITEM, FW_VERS major/minor
+            log.info("Reading controller info block")
+            response.registers = [1, 750, 1, 1, 0][:count]
         elif address == 0x2011:
             # SERIES
             log.info("Reading SERIES")
@@ -27,6 +27,16 @@ class MockModbusTcpClientForDaliModule(MockModbusTcpClient):
         self._discrete_inputs = []  # 0 discrete inputs
         self._coils = []  # 0 coils
 
+    def reset(self) -> None:
+        """Blank the register state in place.
+
+        Cheaper than reconstructing the mock or the hub between tests:
+        the slice assignment reuses the existing lists, so references
+        held by the hub under test stay valid.
+        """
+        self._input_registers[:] = (0, 0, 0)
+        self._holding_registers[:] = (0, 0, 0)
+
     def read_input_registers(self, address=0, count=2) -> ModbusPDU:
         """Read the input registers."""
         if address >= 0x1000:
@@ -78,7 +78,7 @@ def test_transmit_request_control_bit(
     dali_module: Wg750DaliMaster,
 ) -> None:
     """Test the transmit request control bit."""
-    dali_modbus_mock.initialize_state()
+    dali_modbus_mock.reset()
     assert dali_hub.connection is not None, "Dali hub should be connected"
     dali_hub.connection.update_state()
     assert dali_module.modbus_channels["holding"][0].read_lsb() == 0, (
@@ -125,7 +125,7 @@ def test_dali_command_query_short_address_present(
     dali_module: Wg750DaliMaster,
 ) -> None:
     """Test the query short address present command."""
-    dali_modbus_mock.initialize_state()
+    dali_modbus_mock.reset()
     assert dali_hub.connection is not None, "Dali hub should be connected"
     dali_hub.connection.update_state()
     command: ModuleSetup = ModuleSetup(dali_module.dali_communication_register)
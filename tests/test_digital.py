@@ -75,52 +75,56 @@ def test_digital_input_channel_read(
     modbus_mock_with_modules: MockModbusTcpClient, configured_hub: PLCHub
 ) -> None:
     """Test reading from digital input channels."""
+    # The module filter is loop-invariant; collect the channels once
+    channels = []
+    for module in configured_hub.modules:
+        if not module.spec.io_type.digital or not module.spec.io_type.input:
+            continue
+        assert module.channels is not None, f"Module {module} has no channels"
+        channels.extend(module.channels)
+
     for _ in range(10):  # Test multiple random states
         modbus_mock_with_modules.randomize_state()
         if configured_hub.connection is not None:
             configured_hub.connection.update_state()
 
-        for module in configured_hub.modules:
-            if not module.spec.io_type.digital or not module.spec.io_type.input:
-                continue
-
-            assert module.channels is not None, f"Module {module} has no channels"
-
-            for channel in module.channels:
-                value = channel.read()
-                assert isinstance(value, bool), (
-                    f"Channel {channel} read should return a boolean value"
-                )
+        for channel in channels:
+            value = channel.read()
+            assert isinstance(value, bool), (
+                f"Channel {channel} read should return a boolean value"
+            )
 
-                if hasattr(channel, "modbus_channel") and channel.modbus_channel:
-                    address = channel.modbus_channel.address
-                    mock_result = modbus_mock_with_modules.read_discrete_inputs(address)
-                    mock_value = bool(mock_result.bits[0])
-                    error_msg = f"Channel {channel} value {value} doesn't match mock value {mock_value}"
-                    assert value == mock_value, error_msg
+            if hasattr(channel, "modbus_channel") and channel.modbus_channel:
+                address = channel.modbus_channel.address
+                mock_result = modbus_mock_with_modules.read_discrete_inputs(address)
+                mock_value = bool(mock_result.bits[0])
+                error_msg = f"Channel {channel} value {value} doesn't match mock value {mock_value}"
+                assert value == mock_value, error_msg
 
 
 def test_digital_output_channel_write(
     modbus_mock_with_modules: MockModbusTcpClient, configured_hub: PLCHub
 ) -> None:
     """Test writing to digital output channels."""
+    # The module filter is loop-invariant; collect the channels once
+    channels = []
+    for module in configured_hub.modules:
+        if not module.spec.io_type.digital or not module.spec.io_type.output:
+            continue
+        assert module.channels is not None, f"Module {module} has no channels"
+        channels.extend(module.channels)
+
     for _ in range(10):  # Test multiple random values
-        for module in configured_hub.modules:
-            if not module.spec.io_type.digital or not module.spec.io_type.output:
-                continue
-
-            assert module.channels is not None, f"Module {module} has no channels"
-
-            for channel in module.channels:
-                test_value = bool(randint(0, 1))
-                channel.write(test_value)
-
-                if hasattr(channel, "modbus_channel") and channel.modbus_channel:
-                    address = channel.modbus_channel.address
-                    mock_result = modbus_mock_with_modules.read_coils(address)
-                    mock_value = bool(mock_result.bits[0])
-                    error_msg = f"Channel {channel} written value {test_value} doesn't match mock value {mock_value}"
-                    assert test_value == mock_value, error_msg
+        for channel in channels:
+            test_value = bool(randint(0, 1))
+            channel.write(test_value)
+
+            if hasattr(channel, "modbus_channel") and channel.modbus_channel:
+                address = channel.modbus_channel.address
+                mock_result = modbus_mock_with_modules.read_coils(address)
+                mock_value = bool(mock_result.bits[0])
+                error_msg = f"Channel {channel} written value {test_value} doesn't match mock value {mock_value}"
+                assert test_value == mock_value, error_msg
 
 
 def test_digital_channel_callbacks(
@@ -8,8 +8,11 @@ import pytest
 from pytest_subtests import SubTests
 
 from wg750xxx.modules.module import WagoModule
+from wg750xxx.settings import HubConfig
 from wg750xxx.wg750xxx import PLCHub
 
+from .mock.mock_modbus_tcp_client import MockModbusTcpClient
+
 logger = logging.getLogger(__name__)
 
 # ruff: noqa: SLF001
@@ -17,10 +20,8 @@ logger = logging.getLogger(__name__)
 
 def test_module_digital_input_bits_match(configured_hub: PLCHub) -> None:
     """Test if the digital input configuration matches the configured modules."""
-    sum_bits_configured_modules: int = sum(
-        i.spec.modbus_channels.get("discrete", 0)
-        for i in configured_hub.modules
-        if i.spec.io_type.digital and i.spec.io_type.input
+    sum_bits_configured_modules: int = configured_hub.sum_channels(
+        "discrete", digital=True, direction="input"
     )
     # Directly set the process_state_width for testing purposes
     configured_hub._process_state_width["discrete"] = sum_bits_configured_modules
@@ -35,10 +36,8 @@ def test_module_digital_input_bits_match(configured_hub: PLCHub) -> None:
 
 def test_module_digital_output_bits_match(configured_hub: PLCHub) -> None:
     """Test if the digital output configuration matches the configured modules."""
-    sum_bits_configured_modules: int = sum(
-        i.spec.modbus_channels.get("coil", 0)
-        for i in configured_hub.modules
-        if i.spec.io_type.digital and i.spec.io_type.output
+    sum_bits_configured_modules: int = configured_hub.sum_channels(
+        "coil", digital=True, direction="output"
     )
     # Directly set the process_state_width for testing purposes
     configured_hub._process_state_width["coil"] = sum_bits_configured_modules
@@ -52,12 +51,7 @@ def test_module_digital_output_bits_match(configured_hub: PLCHub) -> None:
 def test_module_analog_input_bits_match(configured_hub: PLCHub) -> None:
     """Test if the analog input configuration matches the configured modules."""
     sum_bits_configured_modules: int = (
-        sum(
-            i.spec.modbus_channels.get("input", 0)
-            for i in configured_hub.modules
-            if not i.spec.io_type.digital and i.spec.io_type.input
-        )
-        * 16
+        configured_hub.sum_channels("input", digital=False, direction="input") * 16
     )
     # Directly set the process_state_width for testing purposes
     configured_hub._process_state_width["input"] = sum_bits_configured_modules
@@ -73,12 +67,7 @@ def test_module_analog_input_bits_match(configured_hub: PLCHub) -> None:
 def test_module_analog_output_bits_match(configured_hub: PLCHub) -> None:
     """Test if the analog output configuration matches the configured modules."""
     sum_bits_configured_modules: int = (
-        sum(
-            i.spec.modbus_channels.get("holding", 0)
-            for i in configured_hub.modules
-            if not i.spec.io_type.digital and i.spec.io_type.output
-        )
-        * 16
+        configured_hub.sum_channels("holding", digital=False, direction="output") * 16
     )
     # Directly set the process_state_width for testing purposes
     configured_hub._process_state_width["holding"] = sum_bits_configured_modules
@@ -134,6 +123,48 @@ def test_all_configured_modules_present(
             ], f"Module {module_id} is missing from the hub"
 
 
+def test_channels_by_type_invalidated_by_discovery(
+    modbus_mock_with_modules: MockModbusTcpClient,
+) -> None:
+    """Test that re-discovery does not leave a stale channel registry.
+
+    run_discovery rebuilds the module list through Modules directly,
+    bypassing the hub-level append/reset wrappers, so the registry must
+    be invalidated inside Modules itself. Uses its own hub instance so
+    the shared configured_hub is not mutated.
+    """
+    hub_instance = PLCHub(HubConfig(host="dummy", port=502), initialize=False)
+    hub_instance.connect()
+    hub_instance.initialize(discovery=True)
+    stale = hub_instance.channels_by_type
+    assert stale["discrete"], "Error: No discrete channels after initialization"
+    # Reset through Modules directly, as _get_connected_modules_from_controller
+    # and _autocreate_modules do
+    hub_instance.modules.reset_modules()
+    assert all(not channels for channels in hub_instance.channels_by_type.values()), (
+        "Error: registry still serves channels from the discarded modules"
+    )
+    # Forget the last discovery result and re-discover; the direct appends
+    # in _autocreate_modules must invalidate the empty registry built above
+    hub_instance._discovery_register_values = []
+    hub_instance.reset_modules()
+    assert hub_instance.run_discovery(), "Error: discovery did not rebuild the modules"
+    fresh = hub_instance.channels_by_type
+    for channel_type, channels in fresh.items():
+        current = [
+            channel
+            for module in hub_instance.modules
+            for channel in module.modbus_channels.get(channel_type, ())
+        ]
+        assert len(channels) == len(current) and all(
+            registered is live
+            for registered, live in zip(channels, current, strict=True)
+        ), f"Error: {channel_type} registry serves stale channel objects"
+    assert stale["discrete"][0] is not fresh["discrete"][0], (
+        "Error: registry still serves channels from the discarded modules"
+    )
+
+
 @pytest.mark.parametrize(
     ("module_idx", "modbus_channel_type", "start_address"),
     [
@@ -1,8 +1,12 @@
 """Test the Modbus channel."""
 
 # pylint: disable=protected-access,redefined-outer-name,unused-argument
+from collections.abc import Callable
 import logging
-from random import randint
+from typing import NamedTuple
+
+import numpy as np
+import pytest
 
 from wg750xxx.wg750xxx import PLCHub
 
@@ -12,270 +16,99 @@ from .mock.mock_modbus_tcp_client import MockModbusTcpClient
 
 logger = logging.getLogger(__name__)
 
-
-def test_modbus_discrete_input_channel_read(
-    modbus_mock_with_modules: MockModbusTcpClient, configured_hub: PLCHub
-) -> None:
-    """Test the read method of the Discrete input channel."""
-    for _ in range(50):
-        modbus_mock_with_modules.randomize_state()
-        if configured_hub.connection is not None:
-            configured_hub.connection.update_state()
-        address = 0
-        for module in configured_hub.modules:
-            # Check if module has digital input
-            if not module.spec.io_type.digital or not module.spec.io_type.input:
-                continue
-            for channel in module.modbus_channels["discrete"]:
-                channel_value = channel.read()
-                mock_value = bool(
-                    modbus_mock_with_modules.read_discrete_inputs(channel.address).bits[
-                        0
-                    ]
-                )
-                assert channel_value == mock_value, (
-                    f"Error: Discrete input channel #{channel.address} read mismatch: Channel Value ({channel_value}) != Mock Value ({mock_value})"
-                )
-                address += 1
-        assert address > 0, "Error: No Discrete input channels found"
-
-
-def test_modbus_coil_channel_read(
-    modbus_mock_with_modules: MockModbusTcpClient, configured_hub: PLCHub
-) -> None:
-    """Test the read method of the Coil channel."""
-    for _ in range(50):
-        modbus_mock_with_modules.randomize_state()
-        if configured_hub.connection is not None:
-            configured_hub.connection.update_state()
-        address = 0
-        for module in configured_hub.modules:
-            # Check if module has digital output
-            if not module.spec.io_type.digital or not module.spec.io_type.output:
-                continue
-            for channel in module.modbus_channels["coil"]:
-                channel_value = channel.read()
-                mock_value = modbus_mock_with_modules.read_coils(channel.address).bits[
-                    0
-                ]
-                assert channel_value == mock_value, (
-                    f"Error: Coil channel #{channel.address} read mismatch: Channel Value ({channel_value}) != Mock Value ({mock_value})"
-                )
-                address += 1
-        assert address > 0, "Error: No Coil channels found"
-
-
-def test_modbus_input_channel_read(
-    modbus_mock_with_modules: MockModbusTcpClient, configured_hub: PLCHub
-) -> None:
-    """Test the read method of the Input channel."""
-    for _ in range(50):
-        modbus_mock_with_modules.randomize_state()
-        if configured_hub.connection is not None:
-            configured_hub.connection.update_state()
-        address = 0
-        for module in configured_hub.modules:
-            # Check if module has analog input
-            if module.spec.io_type.digital or not module.spec.io_type.input:
-                continue
-            for channel in module.modbus_channels["input"]:
-                channel_value = channel.read()
-                mock_value = modbus_mock_with_modules.read_input_registers(
-                    channel.address
-                ).registers[0]
-                assert channel_value == mock_value, (
-                    f"Error: Input channel #{channel.address} read mismatch: Channel Value ({channel_value}) != Mock Value ({mock_value:02x})"
-                )
-                address += 1
-        assert address > 0, "Error: No Input channels found"
-
-
-def test_modbus_holding_channel_read(
-    modbus_mock_with_modules: MockModbusTcpClient, configured_hub: PLCHub
-) -> None:
-    """Test the read method of the Holding channel."""
-    for _ in range(50):
-        modbus_mock_with_modules.randomize_state()
-        if configured_hub.connection is not None:
-            configured_hub.connection.update_state()
-        address = 0
-        for module in configured_hub.modules:
-            # Check if module has analog output
-            if module.spec.io_type.digital or not module.spec.io_type.output:
-                continue
-            for channel in module.modbus_channels["holding"]:
-                channel_value = channel.read()
-                mock_value = modbus_mock_with_modules.read_holding_registers(
-                    channel.address
-                ).registers[0]
-                assert channel_value == mock_value, (
-                    f"Error: Holding channel #{channel.address} read mismatch: Channel Value ({channel_value}) != Mock Value ({mock_value:02x})"
-                )
-                address += 1
-        assert address > 0, "Error: No Holding channels found"
-
-
-def test_modbus_coil_channel_write(
-    modbus_mock_with_modules: MockModbusTcpClient, configured_hub: PLCHub
+# Mock bulk reader and result attribute per register type
+_MOCK_TABLES = {
+    "discrete": ("read_discrete_inputs", "bits"),
+    "coil": ("read_coils", "bits"),
+    "input": ("read_input_registers", "registers"),
+    "holding": ("read_holding_registers", "registers"),
+}
+
+
+class Scenario(NamedTuple):
+    """One channel I/O scenario: what to call and what the mock should hold."""
+
+    channel_type: str
+    method: str
+    # Write draw upper bound, or None for read scenarios
+    high: int | None
+    # Extraction of the expected value from the raw mock table entry
+    extract: Callable[[int], int | bool] = lambda raw: raw
+
+
+_SCENARIOS = [
+    Scenario("discrete", "read", None, bool),
+    Scenario("coil", "read", None),
+    Scenario("input", "read", None),
+    Scenario("holding", "read", None),
+    Scenario("input", "read_lsb", None, lambda raw: raw & 0xFF),
+    Scenario("input", "read_msb", None, lambda raw: (raw & 0xFF00) >> 8),
+    Scenario("coil", "write", 2),
+    Scenario("holding", "write", 65536),
+    Scenario("holding", "write_lsb", 256, lambda raw: raw & 0xFF),
+    Scenario("holding", "write_msb", 256, lambda raw: (raw & 0xFF00) >> 8),
+]
+
+
+@pytest.mark.parametrize(
+    "scenario",
+    _SCENARIOS,
+    ids=[f"{scenario.channel_type}-{scenario.method}" for scenario in _SCENARIOS],
+)
+def test_modbus_channel_io(
+    modbus_mock_with_modules: MockModbusTcpClient,
+    configured_hub: PLCHub,
+    scenario: Scenario,
 ) -> None:
-    """Test the write method of the Coil channel."""
-    for _ in range(50):
+    """Test channel reads and writes against the mock state.
+
+    Read scenarios randomize the mock image each iteration and compare
+    every channel against one bulk mock read; write scenarios write a
+    pre-drawn value per channel and compare the mock table afterwards.
+    """
+    channel_type, method, high, extract = scenario
+    channels = configured_hub.channels_by_type[channel_type]
+    assert channels, f"Error: No {channel_type} channels found"
+    span = max(channel.address for channel in channels) + 1
+    mock_reader_name, result_attr = _MOCK_TABLES[channel_type]
+    mock_reader = getattr(modbus_mock_with_modules, mock_reader_name)
+    writes = high is not None
+
+    if writes:
+        # One seeded vectorized draw for all iterations; .tolist() hands
+        # the loop plain Python scalars and the seed makes failures
+        # reproducible. Randomize only once: the loop overwrites every
+        # exercised channel anyway.
+        draws = np.random.default_rng(seed=0).integers(
+            0, high, size=(50, len(channels)), dtype=np.uint16
+        )
+        if high == 2:
+            draws = draws.astype(bool)
         modbus_mock_with_modules.randomize_state()
         if configured_hub.connection is not None:
             configured_hub.connection.update_state()
-        address = 0
-        for module in configured_hub.modules:
-            # Check if module has digital output
-            if not module.spec.io_type.digital or not module.spec.io_type.output:
-                continue
-            for channel in module.modbus_channels["coil"]:
-                value = bool(randint(0, 1))
-                channel.write(value)
-                mock_value = modbus_mock_with_modules.read_coils(channel.address).bits[
-                    0
-                ]
-                assert value == mock_value, (
-                    f"Error: Coil channel #{channel.address} write mismatch: Channel Value ({value}) != Mock Value ({mock_value})"
-                )
-                address += 1
-        assert address > 0, "Error: No Coil channels found"
 
-
-def test_modbus_holding_channel_write(
-    modbus_mock_with_modules: MockModbusTcpClient, configured_hub: PLCHub
-) -> None:
-    """Test the write method of the Holding channel."""
-    for _ in range(50):
-        modbus_mock_with_modules.randomize_state()
-        if configured_hub.connection is not None:
-            configured_hub.connection.update_state()
-        address = 0
-        for module in configured_hub.modules:
-            # Check if module has analog output
-            if module.spec.io_type.digital or not module.spec.io_type.output:
-                continue
-            for channel in module.modbus_channels["holding"]:
-                value = randint(0, 65535)
-                channel.write(value)
-                mock_value = modbus_mock_with_modules.read_holding_registers(
-                    channel.address
-                ).registers[0]
+    for iteration in range(50):
+        if writes:
+            written = draws[iteration].tolist()
+            for channel, value in zip(channels, written, strict=True):
+                getattr(channel, method)(value)
+        else:
+            modbus_mock_with_modules.randomize_state()
+            if configured_hub.connection is not None:
+                configured_hub.connection.update_state()
+
+        table = getattr(mock_reader(0, count=span), result_attr)
+        if writes:
+            for channel, value in zip(channels, written, strict=True):
+                mock_value = extract(table[channel.address])
                 assert value == mock_value, (
-                    f"Error: Holding channel #{channel.address} write mismatch: Channel Value ({value:02x}) != Mock Value ({mock_value:02x})"
-                )
-                address += 1
-        assert address > 0, "Error: No Holding channels found"
-
-
-def test_modbus_input_channel_read_lsb(
-    modbus_mock_with_modules: MockModbusTcpClient, configured_hub: PLCHub
-) -> None:
-    """Test the read_lsb method of the Input channel."""
-    for _ in range(50):
-        modbus_mock_with_modules.randomize_state()
-        if configured_hub.connection is not None:
-            configured_hub.connection.update_state()
-        address = 0
-        for module in configured_hub.modules:
-            # Check if module has analog input
-            if module.spec.io_type.digital or not module.spec.io_type.input:
-                continue
-            for channel in module.modbus_channels["input"]:
-                channel_value = channel.read_lsb()
-                mock_value = (
-                    modbus_mock_with_modules.read_input_registers(
-                        channel.address
-                    ).registers[0]
-                    & 0xFF
-                )
-                assert channel_value == mock_value, (
-                    f"Error: Input channel #{channel.address} read lsb mismatch: Channel Value ({channel_value}) != Mock Value ({mock_value:02x})"
+                    f"Error: {channel_type} channel #{channel.address} {method} mismatch: Channel Value ({value}) != Mock Value ({mock_value})"
                 )
-                address += 1
-        assert address > 0, "Error: No Input channels found"
-
-
-def test_modbus_input_channel_read_msb(
-    modbus_mock_with_modules: MockModbusTcpClient, configured_hub: PLCHub
-) -> None:
-    """Test the read_msb method of the Input channel."""
-    for _ in range(50):
-        modbus_mock_with_modules.randomize_state()
-        if configured_hub.connection is not None:
-            configured_hub.connection.update_state()
-        address = 0
-        for module in configured_hub.modules:
-            # Check if module has analog input
-            if module.spec.io_type.digital or not module.spec.io_type.input:
-                continue
-            for channel in module.modbus_channels["input"]:
-                channel_value = channel.read_msb()
-                mock_value = (
-                    modbus_mock_with_modules.read_input_registers(
-                        channel.address
-                    ).registers[0]
-                    & 0xFF00
-                ) >> 8
+        else:
+            for channel in channels:
+                channel_value = getattr(channel, method)()
+                mock_value = extract(table[channel.address])
                 assert channel_value == mock_value, (
-                    f"Error: Input channel #{channel.address} read msb mismatch: Channel Value ({channel_value}) != Mock Value ({mock_value:02x})"
-                )
-                address += 1
-        assert address > 0, "Error: No Input channels found"
-
-
-def test_modbus_holding_channel_write_lsb(
-    modbus_mock_with_modules: MockModbusTcpClient, configured_hub: PLCHub
-) -> None:
-    """Test the write_lsb method of the Holding channel."""
-    for _ in range(50):
-        # modbus_mock_with_modules.randomize_state()
-        # if configured_hub.connection is not None:
-        #     configured_hub.connection.update_state()
-        address = 0
-        for module in configured_hub.modules:
-            # Check if module has analog output
-            if module.spec.io_type.digital or not module.spec.io_type.output:
-                continue
-            for channel in module.modbus_channels["holding"]:
-                value = randint(0, 255)
-                channel.write_lsb(value)
-                mock_value = (
-                    modbus_mock_with_modules.read_holding_registers(
-                        channel.address
-                    ).registers[0]
-                    & 0xFF
-                )
-                assert value == mock_value, (
-                    f"Error: Holding channel #{channel.address} write lsb mismatch: Channel Value ({value:02x}) != Mock Value ({mock_value:02x})"
-                )
-                address += 1
-        assert address > 0, "Error: No Holding channels found"
-
-
-def test_modbus_holding_channel_write_msb(
-    modbus_mock_with_modules: MockModbusTcpClient, configured_hub: PLCHub
-) -> None:
-    """Test the write_msb method of the Holding channel."""
-    for _ in range(50):
-        # modbus_mock_with_modules.randomize_state()
-        # if configured_hub.connection is not None:
-        #     configured_hub.connection.update_state()
-        address = 0
-        for module in configured_hub.modules:
-            # Check if module has analog output
-            if module.spec.io_type.digital or not module.spec.io_type.output:
-                continue
-            for channel in module.modbus_channels["holding"]:
-                value = randint(0, 255)
-                channel.write_msb(value)
-                mock_value = (
-                    modbus_mock_with_modules.read_holding_registers(
-                        channel.address
-                    ).registers[0]
-                    & 0xFF00
-                ) >> 8
-                assert value == mock_value, (
-                    f"Error: Holding channel #{channel.address} write msb mismatch: Channel Value ({value:02x}) != Mock Value ({mock_value:02x})"
+                    f"Error: {channel_type} channel #{channel.address} {method} mismatch: Channel Value ({channel_value}) != Mock Value ({mock_value})"
                 )
-                address += 1
-        assert address > 0, "Error: No Holding channels found"
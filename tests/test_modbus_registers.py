@@ -28,6 +28,18 @@ def test_words_copy_method():
     assert copied_words._words[0] == 1
 
 
+def test_words_copy_bulk():
+    """Test that Words.copy() duplicates the buffer, not just the wrapper.
+
+    Comparing the ctypes data pointers pins the single-memcpy behavior:
+    the copy must own a fresh buffer rather than aliasing the original.
+    """
+    original_words = Words(np.arange(1 << 20, dtype=np.uint16))
+    copied_words = original_words.copy()
+    assert copied_words._words.ctypes.data != original_words._words.ctypes.data
+    assert np.array_equal(original_words._words, copied_words._words)
+
+
 def test_bytes_copy_method():
     """Test that the Bytes.copy() method returns a new Bytes instance."""
     # Create a Bytes instance
@@ -225,6 +237,27 @@ def test_words_to_bytes_method():
     assert bytes_instance.value.tolist() == [0x01, 0xFF, 0x02, 0xFF]
 
 
+def test_words_to_bytes_bulk():
+    """Test Words.bytes() against a reference byte swap over a large buffer.
+
+    Pins the bulk behavior so the conversion can stay on the vectorized
+    numpy path instead of a per-word Python loop.
+    """
+    values = np.arange(1024, dtype=np.uint16)
+    words_instance = Words(values.copy())
+
+    bytes_instance = words_instance.bytes()
+    assert isinstance(bytes_instance, Bytes)
+    assert len(bytes_instance) == 2048
+    # Default (little) order emits each word MSB-first, i.e. the
+    # big-endian byte stream of the uint16 buffer
+    assert bytes_instance.value.tolist() == list(values.astype(">u2").tobytes())
+
+    bytes_instance = words_instance.bytes(byteorder="big")
+    assert len(bytes_instance) == 2048
+    assert bytes_instance.value.tolist() == list(values[::-1].astype("<u2").tobytes())
+
+
 def test_words_to_bytes_method_with_byte_order():
     """Test that the Words.to_bytes() method returns a Bytes instance with the correct byte order."""
     # Create a Words instance
@@ -378,6 +411,32 @@ def test_words_eq_method():
     assert words_instance != Words([0x00, 0xFF, 0x00, 0xFF, 0x00])
 
 
+def test_bytes_eq_bulk():
+    """Test Bytes equality over a large buffer.
+
+    Pins the buffer-level comparison so __eq__ can stay one
+    np.array_equal call instead of an element-wise Python loop.
+    """
+    values = np.random.default_rng(0).integers(0, 256, 4096, dtype=np.uint8)
+    bytes_instance = Bytes(values.copy())
+    assert bytes_instance == Bytes(values.copy())
+    changed = values.copy()
+    changed[-1] ^= 0xFF
+    assert bytes_instance != Bytes(changed)
+    assert bytes_instance != Bytes(values[:-1].copy())
+
+
+def test_words_eq_bulk():
+    """Test Words equality over a large buffer, see test_bytes_eq_bulk."""
+    values = np.random.default_rng(0).integers(0, 0x10000, 4096, dtype=np.uint16)
+    words_instance = Words(values.copy())
+    assert words_instance == Words(values.copy())
+    changed = values.copy()
+    changed[-1] ^= 0xFFFF
+    assert words_instance != Words(changed)
+    assert words_instance != Words(values[:-1].copy())
+
+
 def test_words_subset_method():
     """Test that the words_subset() method returns a Words instance."""
     # Create a Words instance
@@ -7,7 +7,6 @@ from collections.abc import Generator
 import pytest
 from pytest_socket import enable_socket, socket_allow_hosts
 
-from wg750xxx.modbus.state import ModbusChannelType
 from wg750xxx.modules.module import WagoModule
 from wg750xxx.modules.spec import IOType
 from wg750xxx.settings import HubConfig, ModuleConfig
@@ -40,11 +39,16 @@ def test_read_register(hub: PLCHub) -> None:
     if client is None:
         pytest.skip("No physical PLC connection")
 
+    # The 0x0000/36 and 0x0024/10 ranges are contiguous, so one bulk
+    # read covers both and gets sliced locally
     register = client.read_input_registers(
-        0x0000, count=36
+        0x0000, count=46
     )  # hub.count_bits_digital_in / 16
     # Store register values for debugging
-    _input_registers = register.registers
+    _input_registers = register.registers[0:36]
+    _input_registers_binary = [
+        format(i, "016b") for i in register.registers[0x0024 : 0x0024 + 10]
+    ]
 
     register = client.read_holding_registers(
         0x0200, count=16
@@ -52,12 +56,6 @@ def test_read_register(hub: PLCHub) -> None:
     # Store register values for debugging
     _holding_registers = register.registers
 
-    register = client.read_input_registers(
-        0x0024, count=10
-    )  # hub.count_bits_digital_in / 16
-    # Store register values for debugging
-    _input_registers_binary = [format(i, "016b") for i in register.registers]
-
     register = client.read_discrete_inputs(
         0x0000, count=146
     )  # hub.count_bits_digital_in
@@ -184,95 +182,63 @@ def test_module_counter_count(hub: PLCHub) -> None:
         assert isinstance(value, int)
 
 
-@pytest.mark.parametrize(
-    ("module_idx", "modbus_channel_type"),
-    [
-        (1, "Int16 Out"),
-        (2, "Digital Out"),
-        (3, "Digital Out"),
-        (4, "Digital Out"),
-        (5, "Digital Out"),
-        (6, "Digital Out"),
-        (7, "Digital Out"),
-        (8, "Digital Out"),
-        (9, "Digital Out"),
-        (10, "Digital Out"),
-        (11, "Digital Out"),
-        (12, "Digital Out"),
-        (13, "Digital Out"),
-        (14, "Digital Out"),
-        (15, "Digital Out"),
-        (16, "Digital Out"),
-        (17, "Digital Out"),
-        (18, "Digital Out"),
-        (19, "Digital In"),
-        (20, "Digital In"),
-        (21, "Digital In"),
-        (22, "Digital In"),
-        (23, "Digital In"),
-        (24, "Digital In"),
-        (25, "Digital In"),
-        (26, "Digital In"),
-        (27, "Digital In"),
-        (28, "Digital In"),
-        (29, "Digital In"),
-        (30, "Digital In"),
-        (31, "Digital In"),
-        (32, "Digital In"),
-        (33, "Int16 In"),
-        (34, "Int16 In"),
-        (35, "Int16 In"),
-        (36, "Int16 In"),
-        (37, "Int16 In"),
-        (38, "Counter 32Bit"),
-        (39, "Counter 32Bit"),
-        (40, "Counter 32Bit"),
-        (41, "Digital In"),
-        (42, "Digital In"),
-        (43, "Digital In"),
-        (44, "Digital In"),
-        (45, "Digital In"),
-        (46, "Dali"),
-    ],
-)
-def test_module_channel_type(
-    hub: PLCHub, module_idx: int, modbus_channel_type: ModbusChannelType
-) -> None:
-    """Test module channel types."""
-    assert hub.modules is not None, "Hub should have modules"
-    modules = hub.modules[module_idx]
-    assert modules is not None, "Module should be present"
-    assert modules.channels is not None, "Module should have channels"
-    for channel in modules.channels:
-        assert channel.channel_type == modbus_channel_type, (
-            f"Error: expected {modbus_channel_type} channel, got {channel.channel_type}"
-        )
+_EXPECTED_CHANNEL_TYPES = [
+    (1, "Int16 Out"),
+    *((idx, "Digital Out") for idx in range(2, 19)),
+    *((idx, "Digital In") for idx in range(19, 33)),
+    *((idx, "Int16 In") for idx in range(33, 38)),
+    *((idx, "Counter 32Bit") for idx in range(38, 41)),
+    *((idx, "Digital In") for idx in range(41, 46)),
+    (46, "Dali"),
+]
+
 
+def test_module_channel_type(hub: PLCHub) -> None:
+    """Test module channel types.
 
-@pytest.mark.parametrize(
-    ("module_idx", "modbus_channel_type", "start_address"),
-    [
-        (1, "holding", 0x0000),
-        (2, "coil", 0x0000),
-        (3, "coil", 0x0004),
-        (4, "coil", 0x0008),
-        (5, "coil", 0x000C),
-        (6, "coil", 0x0010),
-        (7, "coil", 0x0014),
-        (8, "coil", 0x0018),
-        (9, "coil", 0x001C),
-    ],
-)
-def test_module_addresses(
-    hub: PLCHub,
-    module_idx: int,
-    modbus_channel_type: ModbusChannelType,
-    start_address: int,
-) -> None:
-    """Test module addresses."""
-    for index, channel in enumerate(
-        hub.modules[module_idx].modbus_channels[modbus_channel_type]
-    ):
-        assert channel.address == start_address + index, (
-            f"Error: expected address {start_address + index}, got {channel.address}"
+    Checks all modules in one pass and reports every mismatch at once
+    instead of paying pytest setup per parametrized case.
+    """
+    assert hub.modules is not None, "Hub should have modules"
+    mismatches = []
+    for module_idx, channel_type in _EXPECTED_CHANNEL_TYPES:
+        module = hub.modules[module_idx]
+        assert module is not None, "Module should be present"
+        assert module.channels is not None, "Module should have channels"
+        mismatches.extend(
+            f"Error: expected {channel_type} channel at module {module_idx}, got {channel.channel_type}"
+            for channel in module.channels
+            if channel.channel_type != channel_type
+        )
+    assert not mismatches, "\n".join(mismatches)
+
+
+_EXPECTED_START_ADDRESSES = [
+    (1, "holding", 0x0000),
+    (2, "coil", 0x0000),
+    (3, "coil", 0x0004),
+    (4, "coil", 0x0008),
+    (5, "coil", 0x000C),
+    (6, "coil", 0x0010),
+    (7, "coil", 0x0014),
+    (8, "coil", 0x0018),
+    (9, "coil", 0x001C),
+]
+
+
+def test_module_addresses(hub: PLCHub) -> None:
+    """Test module addresses.
+
+    Same one-pass, collect-all-mismatches shape as
+    test_module_channel_type.
+    """
+    mismatches = []
+    for module_idx, channel_type, start_address in _EXPECTED_START_ADDRESSES:
+        mismatches.extend(
+            f"Error: expected address {start_address + index} at module {module_idx}, got {channel.address}"
+            for index, channel in enumerate(
+                hub.modules[module_idx].modbus_channels[channel_type]
+            )
+            if channel.address != start_address + index
         )
+    assert not mismatches, "\n".join(mismatches)